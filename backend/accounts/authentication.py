@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.utils import timezone
+
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+
+CACHE_KEY_PREFIX = "auth:token:"
+
+
+def _token_cache():
+    return caches[getattr(settings, "TOKEN_AUTH_CACHE_ALIAS", "default")]
+
+
+def _cache_key(key):
+    return f"{CACHE_KEY_PREFIX}{key}"
+
+
+def invalidate_token(key):
+    """
+    Drop a cached token -> user resolution.
+    Must be called whenever a token is deleted or replaced.
+    """
+    if key:
+        _token_cache().delete(_cache_key(key))
+
+
+def token_is_expired(created):
+    """
+    True when a token created at `created` is older than TOKEN_EXPIRY_SECONDS.
+    Expiry is disabled when the setting is None.
+    """
+    expiry = getattr(settings, "TOKEN_EXPIRY_SECONDS", None)
+    if not expiry:
+        return False
+    return created + timedelta(seconds=expiry) < timezone.now()
+
+
+def cached_user(user_id):
+    """
+    A User holding only its primary key; every other field is deferred and
+    loads from the database on first access (and is never written back
+    from the cache by a save()).
+    """
+    model = get_user_model()
+    return model.from_db(model.objects.db, ["id"], [user_id])
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that caches what a request needs from the token
+    lookup (user id, is_active, token created) for TOKEN_CACHE_TIMEOUT
+    seconds, with optional token expiry. A cache hit costs no query; the
+    entry is dropped when the token is deleted or its user is saved
+    (accounts/signals.py).
+    """
+
+    def authenticate_credentials(self, key):
+        cache = _token_cache()
+        cache_key = _cache_key(key)
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            user_id, is_active, created = cached
+            if not is_active:
+                raise exceptions.AuthenticationFailed("User inactive or deleted.")
+            if token_is_expired(created):
+                self._expire(key)
+            user = cached_user(user_id)
+            return (user, self.get_model()(key=key, user=user, created=created))
+
+        model = self.get_model()
+        try:
+            token = model.objects.select_related("user").get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed("Invalid token.")
+
+        timeout = getattr(settings, "TOKEN_CACHE_TIMEOUT", 30)
+        if timeout:
+            cache.set(cache_key, (token.user_id, token.user.is_active, token.created), timeout)
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed("User inactive or deleted.")
+
+        if token_is_expired(token.created):
+            self._expire(key)
+
+        return (token.user, token)
+
+    def _expire(self, key):
+        self.get_model().objects.filter(key=key).delete()
+        invalidate_token(key)
+        raise exceptions.AuthenticationFailed("Token has expired.")
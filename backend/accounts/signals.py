@@ -0,0 +1,23 @@
+"""
+Keep the token auth cache (authentication.py) in step with the database.
+"""
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from rest_framework.authtoken.models import Token
+
+from .authentication import invalidate_token
+
+
+@receiver(post_delete, sender=Token)
+def drop_deleted_token(sender, instance, **kwargs):
+    # Also runs for logout, login rotation and cascades from a deleted user
+    invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=get_user_model())
+def drop_user_tokens(sender, instance, **kwargs):
+    # The cached entry carries is_active: deactivation must apply at once
+    for key in Token.objects.filter(user=instance).values_list("key", flat=True):
+        invalidate_token(key)
@@ -7,6 +7,7 @@ from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.permissions import AllowAny, IsAuthenticated
 
+from .authentication import invalidate_token
 from .serializers import RegisterSerializer, UserProfileSerializer
 
 
@@ -32,7 +33,10 @@ class LoginView(APIView):
             )
 
         # 🔒 Enforce single active token
-        Token.objects.filter(user=user).delete()
+        old_tokens = Token.objects.filter(user=user)
+        for key in old_tokens.values_list("key", flat=True):
+            invalidate_token(key)
+        old_tokens.delete()
         token = Token.objects.create(user=user)
 
         return Response(
@@ -70,7 +74,8 @@ class LogoutView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        request.user.auth_token.delete()
+        invalidate_token(getattr(request.auth, "key", None))
+        Token.objects.filter(user=request.user).delete()
         return Response(
             {"message": "Logged out successfully"},
             status=status.HTTP_200_OK,
@@ -0,0 +1,108 @@
+"""
+Dataset loading: `pd.DataFrame(list(queryset.values(...)))` (one dict
+per row) vs equipment.data_access.load_dataset_columns (chunked
+values_list into preallocated NumPy arrays).
+
+Seeds a throwaway dataset per size into the configured database, then
+prints the median load time, the peak traced allocation during the load
+and the size of the resulting DataFrame.
+
+    cd backend
+    python manage.py migrate
+    python benchmarks/data_loading.py --rows 25000,200000
+"""
+import argparse
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+import pandas as pd  # noqa: E402
+from django.contrib.auth.models import User  # noqa: E402
+
+from equipment.data_access import load_dataset_columns  # noqa: E402
+from equipment.models import Dataset, Equipment  # noqa: E402
+
+COLUMNS = ("flowrate", "pressure", "temperature", "equipment_type")
+TYPES = ["Pump", "Valve", "Compressor", "Reactor", "Exchanger", "Condenser"]
+
+
+def seed(user, rows):
+    dataset = Dataset.objects.create(user=user, name=f"bench-{rows}.csv")
+    Equipment.objects.bulk_create(
+        (
+            Equipment(
+                dataset=dataset,
+                equipment_name=f"EQ-{i}",
+                equipment_type=random.choice(TYPES),
+                flowrate=random.uniform(50, 300),
+                pressure=random.uniform(1, 15),
+                temperature=random.uniform(80, 200),
+            )
+            for i in range(rows)
+        ),
+        batch_size=5000,
+    )
+    return dataset
+
+
+def load_dicts(dataset):
+    return pd.DataFrame(list(Equipment.objects.filter(dataset=dataset).values(*COLUMNS)))
+
+
+def load_columns(dataset):
+    return load_dataset_columns(dataset).to_frame()
+
+
+def measure(func, dataset, repeat):
+    func(dataset)  # warm-up (query compilation, imports)
+
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(dataset)
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    df = func(dataset)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return statistics.median(times), peak, df.memory_usage(deep=True).sum()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", default="25000,200000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    User.objects.filter(username="bench-loader").delete()
+    user = User.objects.create_user("bench-loader", password="bench-password-123")
+
+    print(f"{'rows':>8}  {'loader':<8}{'time s':>9}{'peak MB':>10}{'frame MB':>10}")
+    try:
+        for rows in map(int, args.rows.split(",")):
+            dataset = seed(user, rows)
+            for name, func in (("dicts", load_dicts), ("columns", load_columns)):
+                elapsed, peak, frame = measure(func, dataset, args.repeat)
+                print(f"{rows:>8}  {name:<8}{elapsed:>9.3f}{peak / 2**20:>10.1f}{frame / 2**20:>10.1f}")
+    finally:
+        user.delete()
+
+
+if __name__ == "__main__":
+    main()
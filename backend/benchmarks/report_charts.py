@@ -0,0 +1,119 @@
+"""
+Report chart rendering: previous seaborn path vs equipment.charts.
+
+Renders the distribution panel (3 x histogram + KDE) and the correlation
+heatmap from synthetic data at each size and prints the median time.
+With --save-dir both versions are written as PNGs for visual comparison.
+
+    cd backend
+    python benchmarks/report_charts.py --rows 1000,25000,1000000
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import seaborn as sns  # noqa: E402
+
+from equipment import charts  # noqa: E402
+
+COLUMNS = [
+    ("flowrate", "skyblue", "Flowrate Dist."),
+    ("pressure", "salmon", "Pressure Dist."),
+    ("temperature", "lightgreen", "Temperature Dist."),
+]
+
+
+def make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "flowrate": rng.gamma(4.0, 30.0, rows),
+        "pressure": rng.normal(7.0, 2.0, rows),
+        "temperature": np.concatenate([
+            rng.normal(110, 8, rows // 2),
+            rng.normal(160, 12, rows - rows // 2),
+        ]),
+    })
+
+
+def seaborn_charts(df):
+    """
+    The report's original chart code.
+    """
+    fig, axes = plt.subplots(1, 3, figsize=(10, 3.5))
+    for ax, (name, color, title) in zip(axes, COLUMNS):
+        sns.histplot(df[name], ax=ax, color=color, kde=True)
+        ax.set_title(title)
+    plt.tight_layout()
+    buf = BytesIO()
+    plt.savefig(buf, format="png", dpi=120)
+    plt.close(fig)
+
+    plt.figure(figsize=(6, 4))
+    corr = df[[name for name, _, _ in COLUMNS]].corr()
+    sns.heatmap(corr, annot=True, cmap="coolwarm", fmt=".2f", linewidths=0.5)
+    plt.tight_layout()
+    buf2 = BytesIO()
+    plt.savefig(buf2, format="png", dpi=120)
+    plt.close()
+    return buf.getvalue(), buf2.getvalue()
+
+
+def engine_charts(df):
+    numeric = {name: df[name].to_numpy(dtype=float) for name, _, _ in COLUMNS}
+    distributions = charts.distribution_chart([
+        (numeric[name], color, title, name) for name, color, title in COLUMNS
+    ])
+    correlation = charts.correlation_chart(
+        charts.correlation_matrix(list(numeric.values())), list(numeric)
+    )
+    return distributions, correlation
+
+
+def timed(func, df, repeat):
+    func(df)  # warm-up (imports, font cache, figure cache)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(df)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", default="1000,25000,1000000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save-dir")
+    args = parser.parse_args()
+
+    print(f"{'rows':>9}{'seaborn s':>12}{'engine s':>12}{'speedup':>10}")
+    for rows in map(int, args.rows.split(",")):
+        df = make_frame(rows)
+        seaborn_time, seaborn_pngs = timed(seaborn_charts, df, args.repeat)
+        engine_time, engine_pngs = timed(engine_charts, df, args.repeat)
+        print(f"{rows:>9}{seaborn_time:>12.3f}{engine_time:>12.3f}{seaborn_time / engine_time:>9.1f}x")
+
+        if args.save_dir:
+            os.makedirs(args.save_dir, exist_ok=True)
+            for label, pngs in (("seaborn", seaborn_pngs), ("engine", engine_pngs)):
+                for chart, png in zip(("distributions", "correlation"), pngs):
+                    path = os.path.join(args.save_dir, f"{rows}_{chart}_{label}.png")
+                    with open(path, "wb") as f:
+                        f.write(png)
+
+
+if __name__ == "__main__":
+    main()
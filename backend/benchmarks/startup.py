@@ -0,0 +1,138 @@
+"""
+Cold-start benchmark for the backend.
+
+Measures, each in a fresh interpreter:
+  * `python -X importtime manage.py check`: wall time, total import time
+    and the heaviest top-level imports;
+  * first-request latency: django.setup() plus the first request to a
+    cheap endpoint (URLconf and view modules load on that request).
+
+Save a baseline, then compare later runs against it to catch regressions:
+
+    cd backend
+    python benchmarks/startup.py --save
+    python benchmarks/startup.py --check      # exits 1 on regression
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_baseline.json")
+
+FIRST_REQUEST_SNIPPET = """
+import os, sys, time
+start = time.perf_counter()
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+import django
+django.setup()
+from django.test import Client
+setup_done = time.perf_counter()
+Client().get("/api/history/")
+end = time.perf_counter()
+print(setup_done - start, end - setup_done)
+"""
+
+
+def parse_importtime(stderr):
+    """
+    Return {top-level module: cumulative microseconds} from -X importtime output.
+    """
+    top_level = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            # Un-indented entries are imported directly, not as dependencies
+            top_level[name.strip()] = int(cumulative)
+    return top_level
+
+
+def measure_check():
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "manage.py", "check"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    wall = time.perf_counter() - start
+    return wall, parse_importtime(proc.stderr)
+
+
+def measure_first_request():
+    proc = subprocess.run(
+        [sys.executable, "-c", FIRST_REQUEST_SNIPPET],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    setup, first_request = map(float, proc.stdout.split()[-2:])
+    return setup, first_request
+
+
+def run(repeat):
+    check_walls, import_totals, setups, first_requests = [], [], [], []
+    heaviest = {}
+
+    for _ in range(repeat):
+        wall, imports = measure_check()
+        check_walls.append(wall)
+        import_totals.append(sum(imports.values()) / 1e6)
+        heaviest = imports
+
+        setup, first_request = measure_first_request()
+        setups.append(setup)
+        first_requests.append(first_request)
+
+    return {
+        "check_wall_s": round(statistics.median(check_walls), 3),
+        "check_import_s": round(statistics.median(import_totals), 3),
+        "setup_s": round(statistics.median(setups), 3),
+        "first_request_s": round(statistics.median(first_requests), 3),
+        "heaviest_imports_ms": {
+            name: round(us / 1000, 1)
+            for name, us in sorted(heaviest.items(), key=lambda kv: -kv[1])[:10]
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", action="store_true", help="write the result as the new baseline")
+    parser.add_argument("--check", action="store_true", help="fail if slower than the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown ratio")
+    args = parser.parse_args()
+
+    result = run(args.repeat)
+
+    for key in ("check_wall_s", "check_import_s", "setup_s", "first_request_s"):
+        print(f"{key:<18}{result[key]:>8.3f}")
+    print("heaviest top-level imports in `manage.py check` (ms):")
+    for name, ms in result["heaviest_imports_ms"].items():
+        print(f"  {name:<40}{ms:>8.1f}")
+
+    if args.save:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(result, f, indent=2)
+            f.write("\n")
+        print(f"baseline saved to {BASELINE_PATH}")
+
+    if args.check:
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+        regressions = [
+            f"{key}: {result[key]:.3f}s vs baseline {baseline[key]:.3f}s"
+            for key in ("check_wall_s", "check_import_s", "first_request_s")
+            if result[key] > baseline[key] * (1 + args.tolerance)
+        ]
+        if regressions:
+            print("startup regression:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+        print("no startup regression")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Per-worker memory of the gunicorn profile, with and without preloading.
+
+Starts gunicorn with gunicorn.conf.py, sends a round of requests so every
+worker has loaded the views, then reads /proc/<pid>/smaps_rollup (Linux)
+for each worker. RSS counts shared pages in full; PSS splits them between
+the processes sharing them; USS is memory private to the worker.
+
+    cd backend
+    python benchmarks/worker_memory.py --workers 3
+"""
+import argparse
+import http.client
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PORT = 8103
+
+
+def read_memory(pid):
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields["Rss"] / 1024,
+        "pss": fields["Pss"] / 1024,
+        "uss": (fields["Private_Clean"] + fields["Private_Dirty"]) / 1024,
+    }
+
+
+def worker_pids(master_pid):
+    with open(f"/proc/{master_pid}/task/{master_pid}/children") as f:
+        return [int(pid) for pid in f.read().split()]
+
+
+def hit(path):
+    conn = http.client.HTTPConnection("127.0.0.1", PORT, timeout=30)
+    conn.request("GET", path)
+    conn.getresponse().read()
+
+
+def measure(preload, workers):
+    env = dict(
+        os.environ,
+        GUNICORN_PRELOAD=str(preload),
+        WEB_CONCURRENCY=str(workers),
+        GUNICORN_THREADS="1",
+        GUNICORN_LOG_LEVEL="warning",
+        PORT=str(PORT),
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "config.wsgi:application",
+         "-c", "gunicorn.conf.py", "--access-logfile", "/dev/null"],
+        cwd=BACKEND_DIR, env=env,
+    )
+    try:
+        for _ in range(150):
+            try:
+                hit("/admin/login/")
+                break
+            except OSError:
+                time.sleep(0.2)
+
+        # Enough concurrent requests that every worker loads the URLconf
+        with ThreadPoolExecutor(max_workers=workers * 2) as pool:
+            list(pool.map(hit, ["/api/history/"] * workers * 20))
+        time.sleep(1)
+
+        return [read_memory(pid) for pid in worker_pids(proc.pid)]
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12}{'RSS MB':>10}{'PSS MB':>10}{'USS MB':>10}   (mean per worker)")
+    for preload in (False, True):
+        stats = measure(preload, args.workers)
+        mean = {k: sum(s[k] for s in stats) / len(stats) for k in ("rss", "pss", "uss")}
+        label = "preload" if preload else "no preload"
+        print(f"{label:<12}{mean['rss']:>10.1f}{mean['pss']:>10.1f}{mean['uss']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Load benchmark: sync DRF views under gunicorn (WSGI) vs the async
+/api/async/ views under uvicorn (ASGI).
+
+Seeds a throwaway user + dataset into the configured database, starts
+both servers with the same worker count, hammers each read endpoint at
+the given concurrency and prints throughput and latency percentiles.
+
+    cd backend
+    python manage.py migrate && python manage.py createcachetable
+    python benchmarks/wsgi_vs_asgi.py --rows 25000 --concurrency 64
+"""
+import argparse
+import http.client
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+ENDPOINTS = {
+    "summary": ("/api/summary/{id}/", "/api/async/summary/{id}/"),
+    "history": ("/api/history/", "/api/async/history/"),
+    "scatter": ("/api/datasets/{id}/scatter/", "/api/async/datasets/{id}/scatter/"),
+    "stats": ("/api/datasets/{id}/stats/", "/api/async/datasets/{id}/stats/"),
+}
+
+
+def seed(rows):
+    import django
+
+    django.setup()
+    from django.contrib.auth.models import User
+    from rest_framework.authtoken.models import Token
+    from equipment.models import Dataset, Equipment
+
+    User.objects.filter(username="bench-user").delete()
+    user = User.objects.create_user("bench-user", password="bench-password-123")
+    token = Token.objects.create(user=user)
+    dataset = Dataset.objects.create(user=user, name="bench.csv")
+
+    types = ["Pump", "Valve", "Compressor", "Reactor", "Exchanger", "Condenser"]
+    Equipment.objects.bulk_create(
+        [
+            Equipment(
+                dataset=dataset,
+                equipment_name=f"EQ-{i}",
+                equipment_type=random.choice(types),
+                flowrate=random.uniform(50, 300),
+                pressure=random.uniform(1, 15),
+                temperature=random.uniform(80, 200),
+            )
+            for i in range(rows)
+        ],
+        batch_size=2000,
+    )
+    return user, token.key, dataset.id
+
+
+def start_server(kind, port, workers):
+    if kind == "wsgi":
+        cmd = [
+            sys.executable, "-m", "gunicorn", "config.wsgi:application",
+            "--bind", f"127.0.0.1:{port}", "--workers", str(workers),
+            "--log-level", "warning",
+        ]
+    else:
+        cmd = [
+            sys.executable, "-m", "uvicorn", "config.asgi:application",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ]
+    proc = subprocess.Popen(cmd, cwd=BACKEND_DIR)
+
+    for _ in range(100):
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/api/history/")
+            conn.getresponse().read()
+            return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError(f"{kind} server did not start on port {port}")
+
+
+def run_load(port, path, token, concurrency, total):
+    local = threading.local()
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def one_request(_):
+        if not hasattr(local, "conn"):
+            local.conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        start = time.perf_counter()
+        try:
+            local.conn.request("GET", path, headers={"Authorization": f"Token {token}"})
+            response = local.conn.getresponse()
+            response.read()
+            ok = response.status == 200
+        except (OSError, http.client.HTTPException):
+            local.conn.close()
+            del local.conn
+            ok = False
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            if not ok:
+                errors[0] += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_request, range(total)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / wall,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "errors": errors[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=25_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS))
+    args = parser.parse_args()
+
+    user, token, dataset_id = seed(args.rows)
+    servers = {
+        "wsgi": start_server("wsgi", 8101, args.workers),
+        "asgi": start_server("asgi", 8102, args.workers),
+    }
+
+    try:
+        print(
+            f"rows={args.rows} concurrency={args.concurrency} "
+            f"requests={args.requests} workers={args.workers}"
+        )
+        print(f"{'endpoint':<10}{'server':<6}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}")
+        for name in args.endpoints.split(","):
+            for kind, port, path in zip(("wsgi", "asgi"), (8101, 8102), ENDPOINTS[name]):
+                result = run_load(
+                    port, path.format(id=dataset_id), token,
+                    args.concurrency, args.requests,
+                )
+                print(
+                    f"{name:<10}{kind:<6}{result['rps']:>9.1f}{result['p50']:>10.1f}"
+                    f"{result['p95']:>10.1f}{result['errors']:>8}"
+                )
+    finally:
+        for proc in servers.values():
+            proc.terminate()
+            proc.wait()
+        user.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ pip install -r requirements.txt
 
 python manage.py collectstatic --no-input
 python manage.py migrate
+python manage.py createcachetable
+python manage.py backfill_aggregates
 
 # Create superuser if it doesn't exist (Requires DJANGO_SUPERUSER_EMAIL, etc. in Environment)
 if [ "$DJANGO_SUPERUSER_USERNAME" ]; then
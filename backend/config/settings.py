@@ -9,6 +9,10 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = os.environ.get('SECRET_KEY', 'django-insecure-change-this-later')
 DEBUG = os.environ.get('RENDER', 'False') == 'False'  # Debug ON locally, OFF on Render
 ALLOWED_HOSTS = ['*'] # Simplified for deployment; Render will handle routing
+# TLS ends at Render's proxy: take scheme and host from its headers so
+# absolute URLs (report status_url / download_url) come out as https
+SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
+USE_X_FORWARDED_HOST = True
 
 # APPLICATIONS
 INSTALLED_APPS = [
@@ -25,6 +29,7 @@ INSTALLED_APPS = [
     'corsheaders',                 # ✅ ADD THIS
 
     # Local apps
+    'accounts',                    # token auth cache signals
     'equipment',
 ]
 
@@ -35,6 +40,7 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware', # ETag + 304 for If-None-Match (desktop cache)
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -65,8 +71,10 @@ TEMPLATES = [
     },
 ]
 
-# WSGI
+# WSGI / ASGI
 WSGI_APPLICATION = 'config.wsgi.application'
+ASGI_APPLICATION = 'config.asgi.application'
+ASYNC_CPU_WORKERS = int(os.environ.get('ASYNC_CPU_WORKERS', 4))  # thread pool for pandas work in async views
 
 # DATABASE
 DATABASES = {
@@ -95,17 +103,91 @@ STATIC_URL = 'static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
+# MEDIA (stored report artifacts)
+MEDIA_URL = 'media/'
+MEDIA_ROOT = os.environ.get('MEDIA_ROOT', os.path.join(BASE_DIR, 'media'))
+
+# REPORT JOBS
+REPORT_JOB_WORKERS = int(os.environ.get('REPORT_JOB_WORKERS', 2))  # render threads per web worker
+REPORT_JOB_STALE_AFTER = 600  # seconds before an unfinished job is re-queued
+REPORT_SPOOL_MAX_MEMORY = int(os.environ.get('REPORT_SPOOL_MAX_MEMORY', 4 * 1024 * 1024))  # bytes of PDF kept in memory before spilling to disk
+
+# HTML REPORT FRAGMENT CACHE (keyed per dataset, see equipment/views.py)
+REPORT_HTML_CACHE_ALIAS = 'shared'
+REPORT_HTML_CACHE_TIMEOUT = 24 * 60 * 60
+
+# REPORT CHART RENDERERS
+REPORT_RENDER_POOL_SIZE = int(os.environ.get('REPORT_RENDER_POOL_SIZE', 2))  # renderer processes per web worker (~70 MB each), 0 = inline
+REPORT_RENDER_IDLE_TIMEOUT = int(os.environ.get('REPORT_RENDER_IDLE_TIMEOUT', 0))  # seconds without a report before renderers exit, 0 = never
+REPORT_RENDER_TIMEOUT = int(os.environ.get('REPORT_RENDER_TIMEOUT', 60))  # seconds per chart
+
 # DEFAULT PRIMARY KEY
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# CACHE
+# Local memory per worker by default; set REDIS_URL to share it across workers
+REDIS_URL = os.environ.get('REDIS_URL')
+
+# 'shared' must be visible to every worker process (Redis, or the DB cache table)
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        },
+        'shared': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+        'shared': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'shared_cache',  # python manage.py createcachetable
+        },
+    }
+
+# TOKEN AUTH
+# Shared so logout and deactivation invalidate the token on every worker
+TOKEN_AUTH_CACHE_ALIAS = 'shared'
+TOKEN_CACHE_TIMEOUT = int(os.environ.get('TOKEN_CACHE_TIMEOUT', 30))  # seconds, 0 disables caching
+TOKEN_EXPIRY_SECONDS = int(os.environ.get('TOKEN_EXPIRY_SECONDS', 0)) or None  # None = tokens never expire
+
+# ADMISSION CONTROL (expensive endpoints)
+ADMISSION_CACHE_ALIAS = 'shared'
+ADMISSION_CONCURRENCY_LIMITS = {
+    'report': int(os.environ.get('REPORT_MAX_CONCURRENCY', 2)),
+    'upload': int(os.environ.get('UPLOAD_MAX_CONCURRENCY', 2)),
+    # Report jobs queued or rendering, across all workers (held until the job ends)
+    'report_job': int(os.environ.get('REPORT_JOB_MAX_ACTIVE', 4)),
+}
+ADMISSION_SLOT_TIMEOUT = 300  # seconds before a leaked slot is reclaimed
+ADMISSION_RETRY_AFTER = 5  # seconds, sent as Retry-After on 503
+
+# SINGLE-FLIGHT (coalesce identical report / stats / scatter computations)
+# Cross-worker coalescing needs Redis; on the DB cache table every cheap read
+# would turn into several writes. Without it, threads of one worker still coalesce
+SINGLE_FLIGHT_CACHE_ALIAS = 'shared' if REDIS_URL else None
+SINGLE_FLIGHT_LOCK_TIMEOUT = 120  # seconds a leader may hold the cross-worker lock
+SINGLE_FLIGHT_WAIT_TIMEOUT = 120  # seconds a follower waits before computing itself
+SINGLE_FLIGHT_RESULT_TTL = 5  # seconds waiting followers have to pick up a finished result
+
 # DRF CONFIG
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework.authentication.TokenAuthentication',
+        'accounts.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_THROTTLE_RATES': {
+        'report': os.environ.get('REPORT_THROTTLE_RATE', '10/min'),
+        'upload': os.environ.get('UPLOAD_THROTTLE_RATE', '30/hour'),
+    },
 }
 
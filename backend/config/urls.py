@@ -11,6 +11,9 @@ urlpatterns = [
     # 🔐 Auth (login)
     path('api/auth/login/', obtain_auth_token, name='api-login'),
 
+    # ⚡ Async read endpoints (serve under ASGI)
+    path('api/async/', include('equipment.async_urls')),
+
     # 📦 Equipment APIs
     path('api/', include('equipment.urls')),
 ]
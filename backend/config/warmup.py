@@ -0,0 +1,36 @@
+"""
+Pre-fork warm-up for the production server.
+
+Called once in the gunicorn master (see gunicorn.conf.py) so the URLconf,
+views and the heavy analytics / rendering stack are imported before
+workers fork and shared copy-on-write instead of loaded per worker.
+"""
+import gc
+
+
+def warm_up():
+    from django.db import connections
+    from django.urls import get_resolver
+
+    # Importing the URLconf pulls in every view module
+    get_resolver().url_patterns
+
+    # Everything the views otherwise load lazily on first use
+    from equipment import charts, lazy_imports
+    from equipment import reports  # noqa: F401 (pulls in reportlab)
+    from reportlab.lib.styles import getSampleStyleSheet
+
+    lazy_imports.pandas()
+
+    # Build matplotlib's font cache, the chart figures and reportlab's styles now
+    sample = [float(i) for i in range(10)]
+    charts.distribution_chart([(sample, "skyblue", "warm-up", "x")] * 3)
+    charts.correlation_chart([[1.0]], ["x"])
+    getSampleStyleSheet()
+
+    # Never share DB connections across forks
+    connections.close_all()
+
+    # Keep the GC from touching (and un-sharing) the preloaded objects
+    gc.collect()
+    gc.freeze()
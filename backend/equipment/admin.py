@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Dataset, Equipment
+from .models import Dataset, Equipment, ReportArtifact
 
 
 @admin.register(Dataset)
@@ -25,3 +25,18 @@ class EquipmentAdmin(admin.ModelAdmin):
     search_fields = ('equipment_name',)
     ordering = ('-created_at',)
     readonly_fields = ('created_at',)
+
+
+@admin.register(ReportArtifact)
+class ReportArtifactAdmin(admin.ModelAdmin):
+    list_display = (
+        'id',
+        'dataset',
+        'template_version',
+        'status',
+        'created_at',
+        'completed_at',
+    )
+    list_filter = ('status', 'template_version')
+    ordering = ('-created_at',)
+    readonly_fields = ('created_at', 'updated_at', 'completed_at')
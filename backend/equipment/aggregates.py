@@ -0,0 +1,102 @@
+"""
+Per-dataset aggregates stored on the Dataset row.
+
+Computed once when a CSV is uploaded: the summary_* fields, descriptive
+statistics and a histogram per numeric column. Readers such as the
+comparison report then cost O(datasets), not O(rows). Datasets uploaded
+before these fields existed are filled in by
+`manage.py backfill_aggregates`, never inside a request.
+"""
+from .data_access import NUMERIC_COLUMNS, load_dataset_columns
+from .lazy_imports import numpy
+
+
+HISTOGRAM_MAX_BINS = 50
+
+
+def build_dataset_stats(df):
+    """
+    Descriptive statistics and correlation matrix for the numeric columns.
+    NaN (e.g. std of a single row) is returned as None.
+    """
+    numeric = df[NUMERIC_COLUMNS]
+    desc = numeric.describe().round(4)
+    corr = numeric.corr().round(4)
+
+    return {
+        "count": len(df),
+        "statistics": desc.astype(object).where(desc.notna(), None).to_dict(),
+        "correlation": corr.astype(object).where(corr.notna(), None).to_dict(),
+    }
+
+
+def build_histogram(values):
+    """
+    Histogram as {"edges": [...], "counts": [...]}, numpy's "auto" bins
+    capped at HISTOGRAM_MAX_BINS so stored rows stay small.
+    """
+    np = numpy()
+    values = values[np.isfinite(values)]
+    if not values.size:
+        return {"edges": [], "counts": []}
+
+    edges = np.histogram_bin_edges(values, bins="auto")
+    if len(edges) - 1 > HISTOGRAM_MAX_BINS:
+        edges = np.histogram_bin_edges(values, bins=HISTOGRAM_MAX_BINS)
+
+    counts, edges = np.histogram(values, bins=edges)
+    return {"edges": edges.tolist(), "counts": counts.tolist()}
+
+
+def stored_summary(dataset):
+    """
+    The stored aggregates in build_dataset_summary's shape.
+    """
+    return {
+        "total_equipment": dataset.summary_total,
+        "average_flowrate": dataset.summary_avg_flowrate,
+        "average_pressure": dataset.summary_avg_pressure,
+        "average_temperature": dataset.summary_avg_temperature,
+        "equipment_type_distribution": dataset.summary_type_distribution,
+    }
+
+
+def compute_dataset_aggregates(dataset):
+    """
+    Field values for every stored aggregate of `dataset`.
+    """
+    df = load_dataset_columns(dataset).to_frame()
+
+    def mean(column):
+        return float(df[column].mean()) if len(df) else None
+
+    return {
+        "summary_total": len(df),
+        "summary_avg_flowrate": mean("flowrate"),
+        "summary_avg_pressure": mean("pressure"),
+        "summary_avg_temperature": mean("temperature"),
+        "summary_type_distribution": {
+            str(name): int(count)
+            for name, count in df["equipment_type"].value_counts().items()
+        },
+        "summary_stats": build_dataset_stats(df),
+        "summary_histograms": {
+            column: build_histogram(df[column].to_numpy(dtype=float))
+            for column in NUMERIC_COLUMNS
+        },
+    }
+
+
+def store_dataset_aggregates(dataset):
+    fields = compute_dataset_aggregates(dataset)
+    for name, value in fields.items():
+        setattr(dataset, name, value)
+    dataset.save(update_fields=list(fields))
+    return dataset
+
+
+def has_stored_aggregates(dataset):
+    """
+    False for datasets still waiting for backfill_aggregates.
+    """
+    return dataset.summary_histograms is not None
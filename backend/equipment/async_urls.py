@@ -0,0 +1,29 @@
+from django.urls import path
+
+from . import async_views
+
+urlpatterns = [
+    path(
+        "summary/<int:dataset_id>/",
+        async_views.dataset_summary,
+        name="async-dataset-summary",
+    ),
+
+    path(
+        "history/",
+        async_views.dataset_history,
+        name="async-dataset-history",
+    ),
+
+    path(
+        "datasets/<int:dataset_id>/scatter/",
+        async_views.dataset_scatter,
+        name="async-dataset-scatter",
+    ),
+
+    path(
+        "datasets/<int:dataset_id>/stats/",
+        async_views.dataset_stats,
+        name="async-dataset-stats",
+    ),
+]
@@ -0,0 +1,215 @@
+"""
+Async (ASGI-native) variants of the read endpoints.
+
+Served under /api/async/. Queries use Django's async ORM so a slow request
+never holds a worker thread; pandas work runs on a small thread pool.
+Deploy with an ASGI server, e.g. `uvicorn config.asgi:application`.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, models
+from django.http import JsonResponse
+
+from rest_framework.authentication import get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+
+from accounts.authentication import CachedTokenAuthentication
+
+from .models import Dataset, Equipment
+from .views import (
+    cached_scatter_points,
+    compute_dataset_stats,
+    parse_max_points,
+    stats_flight,
+)
+
+
+_cpu_pool = ThreadPoolExecutor(
+    max_workers=settings.ASYNC_CPU_WORKERS,
+    thread_name_prefix="equipment-cpu",
+)
+
+
+async def run_cpu_bound(func, *args):
+    """
+    Run CPU-heavy work off the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_cpu_pool, func, *args)
+
+
+async def run_db_bound(func, *args):
+    """
+    Like run_cpu_bound, for work that also queries the database
+    (e.g. single-flight computations). Closes the pool thread's connection.
+    """
+    def call():
+        try:
+            return func(*args)
+        finally:
+            close_old_connections()
+
+    return await run_cpu_bound(call)
+
+
+# --------------------------------------------------
+# 🔹 Authentication
+# --------------------------------------------------
+async def _authenticate(request):
+    auth = get_authorization_header(request).split()
+
+    if auth and auth[0].lower() == b"token":
+        if len(auth) != 2:
+            raise AuthenticationFailed("Invalid token header.")
+        user, _ = await sync_to_async(
+            CachedTokenAuthentication().authenticate_credentials
+        )(auth[1].decode())
+        return user
+
+    # Session login (GET only, so no CSRF check needed)
+    user = await request.auser()
+    return user if user.is_authenticated else None
+
+
+def async_login_required(view):
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method != "GET":
+            return JsonResponse(
+                {"detail": f'Method "{request.method}" not allowed.'},
+                status=405,
+            )
+        try:
+            user = await _authenticate(request)
+        except AuthenticationFailed as e:
+            return JsonResponse({"detail": str(e.detail)}, status=401)
+
+        if user is None:
+            return JsonResponse(
+                {"detail": "Authentication credentials were not provided."},
+                status=401,
+            )
+
+        request.user = user
+        return await view(request, *args, **kwargs)
+
+    return wrapper
+
+
+async def _get_user_dataset(request, dataset_id):
+    try:
+        return await Dataset.objects.aget(id=dataset_id, user=request.user)
+    except Dataset.DoesNotExist:
+        return None
+
+
+def _no_equipment():
+    return JsonResponse({"error": "No equipment data available."}, status=404)
+
+
+# --------------------------------------------------
+# 🔹 Helper function
+# --------------------------------------------------
+async def abuild_dataset_summary(equipments):
+    averages = await equipments.aaggregate(
+        total=models.Count("id"),
+        flowrate=models.Avg("flowrate"),
+        pressure=models.Avg("pressure"),
+        temperature=models.Avg("temperature"),
+    )
+
+    distribution = {
+        item["equipment_type"]: item["count"]
+        async for item in equipments.values("equipment_type")
+        .annotate(count=models.Count("id"))
+    }
+
+    return {
+        "total_equipment": averages["total"],
+        "average_flowrate": averages["flowrate"],
+        "average_pressure": averages["pressure"],
+        "average_temperature": averages["temperature"],
+        "equipment_type_distribution": distribution,
+    }
+
+
+# --------------------------------------------------
+# 🔹 Views
+# --------------------------------------------------
+@async_login_required
+async def dataset_summary(request, dataset_id):
+    dataset = await _get_user_dataset(request, dataset_id)
+    if dataset is None:
+        return JsonResponse({"detail": "Not found."}, status=404)
+
+    equipments = Equipment.objects.filter(dataset=dataset)
+
+    if not await equipments.aexists():
+        return _no_equipment()
+
+    return JsonResponse(await abuild_dataset_summary(equipments))
+
+
+@async_login_required
+async def dataset_scatter(request, dataset_id):
+    dataset = await _get_user_dataset(request, dataset_id)
+    if dataset is None:
+        return JsonResponse({"detail": "Not found."}, status=404)
+
+    try:
+        max_points = parse_max_points(request.GET.get("max_points"))
+    except ValidationError as e:
+        return JsonResponse(e.detail, status=400)
+
+    if not await Equipment.objects.filter(dataset=dataset).aexists():
+        return _no_equipment()
+
+    scatter = await run_db_bound(cached_scatter_points, dataset, max_points)
+
+    # Encoding tens of thousands of points is CPU-bound
+    return await run_cpu_bound(
+        JsonResponse, {"dataset_id": dataset.id, **scatter}
+    )
+
+
+@async_login_required
+async def dataset_stats(request, dataset_id):
+    dataset = await _get_user_dataset(request, dataset_id)
+    if dataset is None:
+        return JsonResponse({"detail": "Not found."}, status=404)
+
+    if not await Equipment.objects.filter(dataset=dataset).aexists():
+        return _no_equipment()
+
+    stats = await run_db_bound(
+        stats_flight.do, dataset.id, lambda: compute_dataset_stats(dataset)
+    )
+    return JsonResponse({"dataset_id": dataset.id, **stats})
+
+
+@async_login_required
+async def dataset_history(request):
+    response = []
+
+    async for dataset in (
+        Dataset.objects.filter(user=request.user).order_by("-uploaded_at")[:5]
+    ):
+        equipments = Equipment.objects.filter(dataset=dataset)
+
+        if not await equipments.aexists():
+            continue
+
+        response.append(
+            {
+                "dataset_id": dataset.id,
+                "dataset_name": dataset.name,
+                "uploaded_at": dataset.uploaded_at,
+                "summary": await abuild_dataset_summary(equipments),
+            }
+        )
+
+    return JsonResponse(response, safe=False)
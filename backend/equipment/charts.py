@@ -0,0 +1,316 @@
+"""
+Chart engine for report figures.
+
+Histograms and a binned Gaussian KDE are computed with NumPy, then drawn
+with plain matplotlib (Agg) on figures kept alive per thread and cleared
+between renders. Output matches the previous seaborn charts
+(histplot(kde=True) / heatmap(annot=True)) without seaborn's per-row
+KDE evaluation or the pyplot state machine.
+
+Functions take plain NumPy arrays so they can also run in renderer
+processes.
+"""
+import threading
+from io import BytesIO
+
+import numpy as np
+
+from matplotlib import rc_context, rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+
+
+KDE_GRID_SIZE = 200  # points on the drawn curve (seaborn's gridsize)
+KDE_BIN_COUNT = 1024  # linear-binning grid the kernel is convolved on
+HIST_ALPHA = 0.75
+
+_local = threading.local()
+
+
+# --------------------------------------------------
+# 🔹 Numerics
+# --------------------------------------------------
+def finite(values):
+    values = np.asarray(values, dtype=np.float64)
+    return values[np.isfinite(values)]
+
+
+def histogram(values, bins="auto"):
+    """
+    Counts and bin edges, with numpy's "auto" rule (as seaborn uses).
+    """
+    return np.histogram(values, bins=bins)
+
+
+def scott_bandwidth(values):
+    """
+    Scott's rule, as in scipy.stats.gaussian_kde: std * n ** (-1/5).
+    """
+    return values.std(ddof=1) * values.size ** (-0.2)
+
+
+def binned_kde(values, gridsize=KDE_GRID_SIZE, bin_count=KDE_BIN_COUNT):
+    """
+    Gaussian KDE approximated by linear binning + discrete convolution.
+
+    Cost is O(n + bin_count * kernel) instead of O(n * gridsize).
+    Returns (x, density) over [min, max] (seaborn's cut=0),
+    or None when the data has no spread.
+    """
+    n = values.size
+    if n < 2:
+        return None
+
+    low, high = values.min(), values.max()
+    bandwidth = scott_bandwidth(values)
+    if high == low or not bandwidth > 0:
+        return None
+
+    # Pad by 4 bandwidths so the kernel mass near the edges is kept
+    pad = 4 * bandwidth
+    grid_low = low - pad
+    delta = (high - low + 2 * pad) / (bin_count - 1)
+
+    # Linear binning: split each point between its two nearest grid nodes
+    position = (values - grid_low) / delta
+    left = np.floor(position).astype(np.intp)
+    right_weight = position - left
+    counts = np.bincount(left, weights=1 - right_weight, minlength=bin_count)
+    counts += np.bincount(left + 1, weights=right_weight, minlength=bin_count)
+
+    half_width = int(np.ceil(pad / delta))
+    offsets = np.arange(-half_width, half_width + 1) * delta
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    kernel /= bandwidth * np.sqrt(2 * np.pi) * n
+
+    density = np.convolve(counts, kernel, mode="same")
+    grid = grid_low + np.arange(bin_count) * delta
+
+    x = np.linspace(low, high, gridsize)
+    return x, np.interp(x, grid, density)
+
+
+def correlation_matrix(columns):
+    """
+    Pearson correlation of equally long 1-D arrays (pandas' df.corr()).
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.corrcoef(np.vstack(columns))
+
+
+# --------------------------------------------------
+# 🔹 Figure reuse
+# --------------------------------------------------
+def _figure(key, figsize, build):
+    """
+    Per-thread figure cache: Figure objects aren't thread-safe, but each
+    thread can reuse its own instead of constructing one per render.
+    """
+    figures = getattr(_local, "figures", None)
+    if figures is None:
+        figures = _local.figures = {}
+
+    figure = figures.get(key)
+    if figure is None:
+        figure = Figure(figsize=figsize)
+        FigureCanvasAgg(figure)
+        build(figure)
+        figures[key] = figure
+    return figure
+
+
+def _layout(figure):
+    """
+    tight_layout() starting from the default margins, so a reused figure
+    lays out exactly like a new one.
+    """
+    figure.subplots_adjust(**{
+        name: rcParams[f"figure.subplot.{name}"]
+        for name in ("left", "right", "bottom", "top", "wspace", "hspace")
+    })
+    figure.tight_layout()
+
+
+def _save(figure, fmt, dpi):
+    buffer = BytesIO()
+    # SVG keeps text as <text> (not glyph paths): smaller and selectable
+    with rc_context({"svg.fonttype": "none"}):
+        figure.savefig(buffer, format=fmt, dpi=dpi)
+    return buffer.getvalue()
+
+
+def inline_svg(data):
+    """
+    SVG output as markup for embedding in HTML (drops the XML prolog).
+    """
+    text = data.decode("utf-8")
+    return text[text.index("<svg"):]
+
+
+# --------------------------------------------------
+# 🔹 Charts
+# --------------------------------------------------
+def draw_histogram(ax, values, color, title, xlabel):
+    values = finite(values)
+    ax.cla()
+
+    if values.size:
+        counts, edges = histogram(values)
+        widths = np.diff(edges)
+        ax.bar(
+            edges[:-1], counts, width=widths, align="edge",
+            facecolor=to_rgba(color, HIST_ALPHA), edgecolor="black", linewidth=0.5,
+        )
+
+        kde = binned_kde(values)
+        if kde is not None:
+            x, density = kde
+            # Scale to counts, as seaborn does for stat="count"
+            ax.plot(x, density * (counts * widths).sum(), color=color, linewidth=1.5)
+
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Count")
+
+
+def distribution_chart(series, fmt="png", dpi=120):
+    """
+    One histogram + KDE panel per entry of `series`:
+    a list of (values, color, title, xlabel).
+    """
+    figure = _figure(
+        ("distributions", len(series)),
+        (10, 3.5),
+        lambda fig: fig.subplots(1, len(series)),
+    )
+
+    for ax, (values, color, title, xlabel) in zip(figure.axes, series):
+        draw_histogram(ax, values, color, title, xlabel)
+
+    _layout(figure)
+    return _save(figure, fmt, dpi)
+
+
+def correlation_chart(matrix, labels, fmt="png", dpi=120):
+    """
+    Annotated correlation heatmap (seaborn heatmap with annot=True, fmt=".2f").
+    """
+    figure = _figure(
+        "correlation",
+        (6, 4),
+        lambda fig: fig.subplots(1, 2, gridspec_kw={"width_ratios": [20, 1]}),
+    )
+    ax, cax = figure.axes
+    ax.cla()
+    cax.cla()
+
+    matrix = np.asarray(matrix, dtype=np.float64)
+    masked = np.ma.masked_invalid(matrix)
+    size = matrix.shape[0]
+
+    vmin = masked.min() if masked.count() else -1.0
+    vmax = masked.max() if masked.count() else 1.0
+    mesh = ax.pcolormesh(
+        masked, cmap="coolwarm", vmin=vmin, vmax=vmax,
+        edgecolors="white", linewidth=0.5,
+    )
+
+    for i in range(size):
+        for j in range(size):
+            if masked.mask is not np.ma.nomask and masked.mask[i, j]:
+                continue
+            r, g, b, _ = mesh.cmap(mesh.norm(matrix[i, j]))
+            luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
+            ax.text(
+                j + 0.5, i + 0.5, f"{matrix[i, j]:.2f}",
+                ha="center", va="center",
+                color="black" if luminance > 0.408 else "white",
+            )
+
+    ax.set_xlim(0, size)
+    ax.set_ylim(size, 0)
+    ax.set_xticks(np.arange(size) + 0.5, labels)
+    ax.set_yticks(np.arange(size) + 0.5, labels, rotation=90, va="center")
+    ax.tick_params(length=0)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
+    colorbar = figure.colorbar(mesh, cax=cax)
+    colorbar.outline.set_visible(False)
+
+    _layout(figure)
+    return _save(figure, fmt, dpi)
+
+
+def overlaid_histograms_chart(panels, fmt="png", dpi=120):
+    """
+    Precomputed histograms of several datasets overlaid as step outlines,
+    one panel per metric. Counts are normalized to densities so datasets
+    of different sizes share a y-axis.
+    `panels` is a list of (title, xlabel, [(label, color, edges, counts), ...]).
+    """
+    figure = _figure(
+        ("overlaid-histograms", len(panels)),
+        (10, 3.8),
+        lambda fig: fig.subplots(1, len(panels)),
+    )
+
+    for ax, (title, xlabel, histograms) in zip(figure.axes, panels):
+        ax.cla()
+        for label, color, edges, counts in histograms:
+            edges = np.asarray(edges, dtype=np.float64)
+            counts = np.asarray(counts, dtype=np.float64)
+            total = (counts * np.diff(edges)).sum()
+            if not counts.size or not total > 0:
+                continue
+            ax.stairs(counts / total, edges, color=color, linewidth=1.5, label=label)
+
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel("Density")
+
+    handles, labels = figure.axes[0].get_legend_handles_labels()
+    for legend in list(figure.legends):
+        legend.remove()
+    if handles:
+        figure.legend(handles, labels, loc="lower center", ncol=min(len(labels), 6), frameon=False)
+
+    _layout(figure)
+    if handles:
+        # Room for the legend under the panels
+        figure.subplots_adjust(bottom=figure.subplotpars.bottom + 0.12)
+    return _save(figure, fmt, dpi)
+
+
+def grouped_bar_chart(categories, groups, ylabel, fmt="png", dpi=120):
+    """
+    Side-by-side bars per category, one bar per group:
+    `groups` is a list of (label, color, values) aligned with `categories`.
+    """
+    figure = _figure(
+        "grouped-bars",
+        (8, 3.5),
+        lambda fig: fig.subplots(),
+    )
+    ax = figure.axes[0]
+    ax.cla()
+
+    positions = np.arange(len(categories))
+    width = 0.8 / max(len(groups), 1)
+    for i, (label, color, values) in enumerate(groups):
+        ax.bar(
+            positions + (i - (len(groups) - 1) / 2) * width, values,
+            width=width, color=color, edgecolor="black", linewidth=0.5, label=label,
+        )
+
+    if len(categories) > 5:
+        ax.set_xticks(positions, categories, rotation=30, ha="right")
+    else:
+        ax.set_xticks(positions, categories)
+    ax.set_ylabel(ylabel)
+    if groups:
+        ax.legend(frameon=False, fontsize=8)
+
+    _layout(figure)
+    return _save(figure, fmt, dpi)
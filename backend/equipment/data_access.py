@@ -0,0 +1,87 @@
+"""
+Columnar loading of a dataset's Equipment rows.
+
+`load_dataset_columns(dataset)` streams `values_list` tuples from the DB
+cursor in chunks into preallocated NumPy arrays. No per-row dict or
+model instance is built. equipment_type is stored as integer codes into
+a list of names. `to_frame()` wraps those arrays in a DataFrame
+(equipment_type as a pandas Categorical) without copying them again.
+
+    columns = load_dataset_columns(dataset)
+    columns.numeric["flowrate"]     # float64 array
+    columns.type_names[columns.type_codes[0]]
+    df = columns.to_frame()
+"""
+import itertools
+
+from .lazy_imports import numpy, pandas
+from .models import Equipment
+
+
+NUMERIC_COLUMNS = ["flowrate", "pressure", "temperature"]
+CHUNK_SIZE = 2000
+
+
+class DatasetColumns:
+    def __init__(self, numeric, type_codes, type_names):
+        self.numeric = numeric
+        self.type_codes = type_codes
+        self.type_names = type_names
+
+    def __len__(self):
+        return len(self.type_codes)
+
+    def to_frame(self):
+        """
+        DataFrame over the same arrays (flowrate, pressure, temperature,
+        equipment_type as a Categorical).
+        """
+        pd = pandas()
+        data = dict(self.numeric)
+        data["equipment_type"] = pd.Categorical.from_codes(self.type_codes, self.type_names)
+        return pd.DataFrame(data, copy=False)
+
+
+def load_dataset_columns(dataset, chunk_size=CHUNK_SIZE):
+    """
+    Load every Equipment row of `dataset`, ordered by id.
+    """
+    np = numpy()
+    queryset = (
+        Equipment.objects.filter(dataset=dataset)
+        .order_by("id")
+        .values_list(*NUMERIC_COLUMNS, "equipment_type")
+    )
+
+    # Stored at upload; count() for datasets that predate it
+    capacity = dataset.summary_total
+    if capacity is None:
+        capacity = queryset.count()
+
+    values = np.empty((len(NUMERIC_COLUMNS), capacity), dtype=np.float64)
+    codes = np.empty(capacity, dtype=np.int32)
+    categories = {}
+    size = 0
+
+    rows = queryset.iterator(chunk_size=chunk_size)
+    while chunk := list(itertools.islice(rows, chunk_size)):
+        end = size + len(chunk)
+        if end > capacity:
+            # Rows added since the count: grow geometrically
+            capacity = max(end, capacity * 2)
+            grown_values = np.empty((len(NUMERIC_COLUMNS), capacity), dtype=np.float64)
+            grown_values[:, :size] = values[:, :size]
+            grown_codes = np.empty(capacity, dtype=np.int32)
+            grown_codes[:size] = codes[:size]
+            values, codes = grown_values, grown_codes
+
+        *numeric, types = zip(*chunk)
+        values[:, size:end] = numeric
+        codes[size:end] = [categories.setdefault(name, len(categories)) for name in types]
+        size = end
+
+    return DatasetColumns(
+        numeric={column: values[i, :size] for i, column in enumerate(NUMERIC_COLUMNS)},
+        type_codes=codes[:size],
+        type_names=list(categories),
+    )
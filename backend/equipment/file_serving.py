@@ -0,0 +1,159 @@
+import io
+import re
+
+from django.http import FileResponse, HttpResponse
+from django.utils.http import http_date
+
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Chunk size when a file is streamed without sendfile (Django's default is 4 KiB)
+STREAM_BLOCK_SIZE = 64 * 1024
+
+
+def parse_range_header(header, size):
+    """
+    Parse a single-range `Range` header against a file of `size` bytes.
+
+    Returns (start, end) inclusive, None when the header is absent, malformed
+    or asks for several ranges (serve the whole file), or False when the
+    range cannot be satisfied (416).
+    """
+    if not header:
+        return None
+
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None
+
+    start, end = match.groups()
+
+    if not start and not end:
+        return None
+
+    if not start:
+        # Suffix range: the last N bytes
+        length = int(end)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    end = int(end) if end else size - 1
+
+    if start >= size or end < start:
+        return False
+
+    return start, min(end, size - 1)
+
+
+class RangeFile(io.RawIOBase):
+    """
+    Read-only view of `length` bytes of an open file from its current position.
+
+    fileno() and tell() go to the real file, so servers with sendfile support
+    (gunicorn's wsgi.file_wrapper) still send the slice zero-copy, bounded
+    by Content-Length. Other servers get at most `length` bytes from read().
+    """
+
+    def __init__(self, file, length):
+        self.file = file
+        self.remaining = length
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def tell(self):
+        return self.file.tell()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self.file.seek(offset, whence)
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+def ranged_file_response(request, file, filename, content_type, etag=None, last_modified=None):
+    """
+    Serve a stored file (a Django File / FieldFile) with Content-Length,
+    `Accept-Ranges: bytes` and single-range `Range` / `If-Range` support.
+    """
+    size = file.size
+
+    byte_range = parse_range_header(request.META.get("HTTP_RANGE"), size)
+
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if byte_range and if_range and if_range != etag:
+        # The client's partial copy is of an older version: send it all again
+        byte_range = None
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+
+    elif byte_range is None:
+        response = FileResponse(
+            file.open("rb"),
+            as_attachment=True,
+            filename=filename,
+            content_type=content_type,
+        )
+
+    else:
+        start, end = byte_range
+        length = end - start + 1
+        handle = file.open("rb")
+        handle.seek(start)
+
+        response = FileResponse(
+            RangeFile(handle, length),
+            status=206,
+            as_attachment=True,
+            filename=filename,
+            content_type=content_type,
+        )
+        response["Content-Length"] = str(length)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    response.block_size = STREAM_BLOCK_SIZE
+    response["Accept-Ranges"] = "bytes"
+    if etag:
+        response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
+
+
+def spooled_file_response(output, filename, content_type):
+    """
+    Stream a file built on the fly (a rewound SpooledTemporaryFile, see
+    reports.spooled_output) in chunks. The response closes it when done.
+    """
+    size = output.seek(0, io.SEEK_END)
+    output.seek(0)
+
+    response = FileResponse(
+        output,
+        as_attachment=True,
+        filename=filename,
+        content_type=content_type,
+    )
+    response.block_size = STREAM_BLOCK_SIZE
+    response["Content-Length"] = str(size)
+    return response
@@ -0,0 +1,28 @@
+"""
+Lazy accessors for the heavy analytics stack.
+
+pandas and numpy are imported on first use instead of at module load, so
+`manage.py` commands and cheap endpoints (login, history, summary) don't
+pay for it. The rendering stack (reportlab, matplotlib via charts.py) is
+only reached through equipment.reports, which report_jobs imports on the
+first render. Preloaded servers import all of it up front in
+config/warmup.py.
+
+    pd = pandas()
+    df = pd.DataFrame(rows)
+"""
+import functools
+
+
+@functools.cache
+def pandas():
+    import pandas
+
+    return pandas
+
+
+@functools.cache
+def numpy():
+    import numpy
+
+    return numpy
@@ -0,0 +1,286 @@
+"""
+Generate PDF reports for many datasets at once.
+
+    python manage.py generate_reports --user alice --since 2026-09-01 --until 2026-09-30
+    python manage.py generate_reports --ids 12,13,14 --workers 4 --output-dir /tmp/reports
+
+Reports go through the same ReportArtifact records as the API, so
+datasets whose artifact is already current are skipped and everything
+rendered here is served straight from storage afterwards. Reports a web
+worker is rendering right now are waited for (up to --wait seconds)
+rather than rendered twice.
+"""
+import os
+import shutil
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, time as day_time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Count
+from django.utils import timezone
+
+from equipment.models import Dataset, ReportArtifact
+from equipment.report_jobs import (
+    REPORT_TEMPLATE_VERSION,
+    artifact_is_current,
+    prepare_report,
+    report_filename,
+)
+
+
+WAIT_POLL_INTERVAL = 1  # seconds between checks on reports rendered elsewhere
+
+
+def _init_worker():
+    import django
+
+    django.setup()
+    # The batch workers already use every core: render charts inline
+    # instead of each worker starting its own renderer pool
+    settings.REPORT_RENDER_POOL_SIZE = 0
+
+
+def _render(artifact_id):
+    """
+    Runs in a worker process: render one artifact, report the outcome.
+    """
+    from equipment.report_jobs import run_report_job
+
+    start = time.perf_counter()
+    run_report_job(artifact_id)
+    elapsed = time.perf_counter() - start
+
+    artifact = ReportArtifact.objects.get(id=artifact_id)
+    connections.close_all()
+    return artifact_id, artifact.status, artifact.error, elapsed
+
+
+def _parse_date(value, end_of_day=False):
+    try:
+        day = datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise CommandError(f"Invalid date '{value}', expected YYYY-MM-DD.")
+    moment = datetime.combine(day, day_time.max if end_of_day else day_time.min)
+    return timezone.make_aware(moment) if settings.USE_TZ else moment
+
+
+class Command(BaseCommand):
+    help = "Generate PDF reports for a selection of datasets using a process pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", help="only datasets uploaded by this username")
+        parser.add_argument("--since", help="uploaded on or after this date (YYYY-MM-DD)")
+        parser.add_argument("--until", help="uploaded on or before this date (YYYY-MM-DD)")
+        parser.add_argument("--ids", help="comma-separated dataset ids")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="renderer processes (default: one per CPU)",
+        )
+        parser.add_argument("--output-dir", help="also copy every current report into this directory")
+        parser.add_argument(
+            "--wait",
+            type=int,
+            default=300,
+            help="seconds to wait for reports a web worker is rendering (default: 300, 0 to not wait)",
+        )
+
+    def select_datasets(self, options):
+        datasets = Dataset.objects.select_related("user").annotate(rows=Count("equipments"))
+
+        if options["user"]:
+            datasets = datasets.filter(user__username=options["user"])
+        if options["since"]:
+            datasets = datasets.filter(uploaded_at__gte=_parse_date(options["since"]))
+        if options["until"]:
+            datasets = datasets.filter(uploaded_at__lte=_parse_date(options["until"], end_of_day=True))
+        if options["ids"]:
+            try:
+                ids = [int(part) for part in options["ids"].split(",") if part.strip()]
+            except ValueError:
+                raise CommandError("--ids must be a comma-separated list of integers.")
+            datasets = datasets.filter(id__in=ids)
+
+        return list(datasets.filter(rows__gt=0).order_by("id"))
+
+    def handle(self, *args, **options):
+        if options["workers"] < 1:
+            raise CommandError("--workers must be at least 1.")
+
+        datasets = self.select_datasets(options)
+        if not datasets:
+            self.stdout.write("No datasets with equipment data match the selection.")
+            return
+
+        output_dir = options["output_dir"]
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        by_artifact = {}
+        skipped = []
+        in_progress = {}
+        for dataset in datasets:
+            # Running the command is an explicit request: failed reports are retried
+            artifact, needs_render = prepare_report(dataset, retry=True)
+            if needs_render:
+                by_artifact[artifact.id] = dataset
+            elif artifact_is_current(artifact):
+                skipped.append(dataset)
+            else:
+                # Being rendered by a web worker right now
+                in_progress[artifact.id] = dataset
+
+        self.stdout.write(
+            f"{len(datasets)} datasets: {len(by_artifact)} to render, "
+            f"{len(skipped)} already current, {len(in_progress)} in progress elsewhere"
+        )
+
+        rendered, failed, durations = [], [], []
+        start = time.perf_counter()
+
+        if by_artifact:
+            workers = min(options["workers"], len(by_artifact))
+            # Never hand open DB connections to the worker processes
+            connections.close_all()
+
+            outcomes = self.render(list(by_artifact), workers)
+            for done, (artifact_id, status, error, elapsed) in enumerate(outcomes, 1):
+                dataset = by_artifact[artifact_id]
+
+                if status == ReportArtifact.STATUS_READY:
+                    rendered.append(dataset)
+                    durations.append(elapsed)
+                    self.stdout.write(f"[{done}/{len(by_artifact)}] dataset {dataset.id}: {elapsed:.2f}s")
+                else:
+                    failed.append(dataset)
+                    self.stderr.write(f"[{done}/{len(by_artifact)}] dataset {dataset.id} failed: {error or status}")
+
+        elapsed = time.perf_counter() - start
+
+        if in_progress:
+            finished, failed_elsewhere = self.wait_for(in_progress, options["wait"])
+            skipped += finished
+            failed += failed_elsewhere
+
+        if output_dir:
+            self.copy_reports(rendered + skipped, output_dir)
+
+        rows = sum(dataset.rows for dataset in rendered)
+        self.stdout.write(self.style.SUCCESS(
+            f"Rendered {len(rendered)}, skipped {len(skipped)}, failed {len(failed)}, "
+            f"still in progress {len(in_progress)} in {elapsed:.1f}s"
+        ))
+        if rendered:
+            self.stdout.write(
+                f"Throughput: {len(rendered) / elapsed:.2f} reports/s, {rows / elapsed:,.0f} rows/s; "
+                f"per report median {statistics.median(durations):.2f}s, max {max(durations):.2f}s"
+            )
+
+        problems = []
+        if failed:
+            problems.append(f"{len(failed)} report(s) failed: {', '.join(str(d.id) for d in failed)}")
+        if in_progress:
+            problems.append(
+                f"{len(in_progress)} report(s) still being rendered elsewhere: "
+                f"{', '.join(str(d.id) for d in in_progress.values())}"
+            )
+        if problems:
+            raise CommandError("; ".join(problems))
+
+    def render(self, artifact_ids, workers):
+        """
+        Yield (artifact_id, status, error, elapsed) as renders complete.
+
+        A worker that dies (segfault, OOM kill) breaks the pool and fails
+        every render still in it. Those are re-run one per fresh pool, so
+        only the dataset that actually crashes its worker is reported.
+        """
+        crashed = yield from self._run_pool(artifact_ids, workers)
+
+        if len(crashed) > 1:
+            retried = []
+            for artifact_id in crashed:
+                retried += yield from self._run_pool([artifact_id], 1)
+            crashed = retried
+
+        for artifact_id in crashed:
+            ReportArtifact.objects.filter(id=artifact_id).update(
+                status=ReportArtifact.STATUS_FAILED,
+                error="Renderer process crashed.",
+                updated_at=timezone.now(),
+            )
+            yield artifact_id, ReportArtifact.STATUS_FAILED, "Renderer process crashed.", None
+
+    def _run_pool(self, artifact_ids, workers):
+        """
+        Yields the outcomes of one pool, returns the artifact ids lost to
+        a broken pool (re-queued as pending).
+        """
+        crashed = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = {pool.submit(_render, artifact_id): artifact_id for artifact_id in artifact_ids}
+
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except BrokenProcessPool:
+                    crashed.append(futures[future])
+
+        # The dead worker may have claimed its artifact already
+        ReportArtifact.objects.filter(
+            id__in=crashed,
+            status=ReportArtifact.STATUS_RUNNING,
+        ).update(status=ReportArtifact.STATUS_PENDING)
+        connections.close_all()
+        return crashed
+
+    def wait_for(self, in_progress, timeout):
+        """
+        Poll the artifacts in `in_progress` (artifact id -> dataset) until
+        they finish or `timeout` seconds pass. Finished ones are removed
+        from it; returns (ready, failed) datasets.
+        """
+        ready, failed = [], []
+        deadline = time.monotonic() + timeout
+
+        while True:
+            finished = ReportArtifact.objects.filter(id__in=in_progress).exclude(
+                status__in=(ReportArtifact.STATUS_PENDING, ReportArtifact.STATUS_RUNNING),
+            )
+            for artifact_id, status, error in finished.values_list("id", "status", "error"):
+                dataset = in_progress.pop(artifact_id)
+                if status == ReportArtifact.STATUS_READY:
+                    ready.append(dataset)
+                    self.stdout.write(f"dataset {dataset.id}: rendered elsewhere")
+                else:
+                    failed.append(dataset)
+                    self.stderr.write(f"dataset {dataset.id} failed elsewhere: {error or status}")
+
+            if not in_progress or time.monotonic() >= deadline:
+                return ready, failed
+            time.sleep(WAIT_POLL_INTERVAL)
+
+    def copy_reports(self, datasets, output_dir):
+        artifacts = ReportArtifact.objects.filter(
+            dataset__in=datasets,
+            template_version=REPORT_TEMPLATE_VERSION,
+            status=ReportArtifact.STATUS_READY,
+        ).select_related("dataset")
+
+        copied = 0
+        for artifact in artifacts:
+            if not artifact.file:
+                continue
+            with artifact.file.open("rb") as source, open(
+                os.path.join(output_dir, report_filename(artifact.dataset)), "wb"
+            ) as target:
+                shutil.copyfileobj(source, target)
+            copied += 1
+
+        self.stdout.write(f"Copied {copied} report(s) to {output_dir}")
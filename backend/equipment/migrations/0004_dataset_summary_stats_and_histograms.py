@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-19 08:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('equipment', '0003_reportartifact'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dataset',
+            name='summary_histograms',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='dataset',
+            name='summary_stats',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
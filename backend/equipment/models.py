@@ -16,6 +16,8 @@ class Dataset(models.Model):
     summary_avg_pressure = models.FloatField(null=True, blank=True)
     summary_avg_temperature = models.FloatField(null=True, blank=True)
     summary_type_distribution = models.JSONField(null=True, blank=True)
+    summary_stats = models.JSONField(null=True, blank=True)
+    summary_histograms = models.JSONField(null=True, blank=True)
 
     def __str__(self):
         return f"{self.name} ({self.uploaded_at.strftime('%Y-%m-%d %H:%M')})"
@@ -36,3 +38,45 @@ class Equipment(models.Model):
 
     def __str__(self):
         return self.equipment_name
+
+
+class ReportArtifact(models.Model):
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_READY = "ready"
+    STATUS_FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_READY, "Ready"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    dataset = models.ForeignKey(
+        Dataset,
+        related_name='reports',
+        on_delete=models.CASCADE,
+    )
+    template_version = models.CharField(max_length=32)
+    status = models.CharField(
+        max_length=16,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+    )
+    file = models.FileField(upload_to='reports/', blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['dataset', 'template_version'],
+                name='unique_report_per_template_version',
+            ),
+        ]
+
+    def __str__(self):
+        return f"Report for {self.dataset_id} (v{self.template_version}, {self.status})"
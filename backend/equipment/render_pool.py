@@ -0,0 +1,219 @@
+"""
+Pre-warmed renderer processes for report charts.
+
+Chart rendering is CPU-bound and holds the GIL. To keep it out of the web
+worker, it runs in a small process pool. Each renderer imports matplotlib
+and draws a throw-away chart on start, so the font cache and figures are
+ready before the first report. Jobs send plain NumPy arrays (never
+DataFrames), and the distribution and correlation figures render in
+parallel and come back as PNG bytes.
+
+Each web worker starts and warms its pool right after it forks (see
+gunicorn.conf.py). Renderers are spawned, not forked, so each is a full
+interpreter (about 70 MB private) that shares nothing with the preloaded
+web worker. Setting REPORT_RENDER_IDLE_TIMEOUT stops them after that many
+seconds without a report; the next report then starts them again.
+
+REPORT_RENDER_POOL_SIZE = 0 renders inline in the calling thread.
+"""
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from django.conf import settings
+
+from . import charts
+
+
+logger = logging.getLogger(__name__)
+
+DISTRIBUTION_STYLE = [
+    ("flowrate", "skyblue", "Flowrate Dist."),
+    ("pressure", "salmon", "Pressure Dist."),
+    ("temperature", "lightgreen", "Temperature Dist."),
+]
+
+_pool = None
+_pool_lock = threading.Lock()
+# Renders in progress on _pool, and the timer that stops it when idle
+_active = 0
+_idle_timer = None
+
+
+class RenderTimeout(Exception):
+    pass
+
+
+# --------------------------------------------------
+# 🔹 Renderer process side
+# --------------------------------------------------
+def _warm_up():
+    sample = np.arange(10, dtype=np.float64)
+    charts.distribution_chart([(sample, "skyblue", "warm-up", "x")] * len(DISTRIBUTION_STYLE))
+    charts.correlation_chart(np.eye(len(DISTRIBUTION_STYLE)), ["x"] * len(DISTRIBUTION_STYLE))
+
+
+def _ping():
+    return True
+
+
+def _render_distributions(columns, fmt):
+    return charts.distribution_chart([
+        (columns[name], color, title, name) for name, color, title in DISTRIBUTION_STYLE
+    ], fmt=fmt)
+
+
+def _render_correlation(columns, fmt):
+    names = [name for name, _, _ in DISTRIBUTION_STYLE]
+    matrix = charts.correlation_matrix([columns[name] for name in names])
+    return charts.correlation_chart(matrix, names, fmt=fmt)
+
+
+# --------------------------------------------------
+# 🔹 Pool management (web worker side)
+# --------------------------------------------------
+def _acquire_pool():
+    """
+    The renderer pool, started on first use, marked busy until _release_pool.
+    """
+    global _pool, _active, _idle_timer
+    with _pool_lock:
+        if _idle_timer is not None:
+            _idle_timer.cancel()
+            _idle_timer = None
+        if _pool is None:
+            # "spawn": never fork a threaded web worker
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.REPORT_RENDER_POOL_SIZE,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up,
+            )
+        _active += 1
+        return _pool
+
+
+def _release_pool():
+    global _active, _idle_timer
+    with _pool_lock:
+        _active -= 1
+        if _active == 0 and _pool is not None and settings.REPORT_RENDER_IDLE_TIMEOUT > 0:
+            _idle_timer = threading.Timer(settings.REPORT_RENDER_IDLE_TIMEOUT, _shutdown_idle)
+            _idle_timer.daemon = True
+            _idle_timer.start()
+
+
+def _shutdown_idle():
+    global _pool
+    with _pool_lock:
+        if _active:
+            return
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _discard_pool(pool):
+    """
+    Drop a broken pool; the next render starts a fresh one.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+
+    # Reap whatever is left of the pool's processes
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def start():
+    """
+    Spawn and warm every renderer now instead of on the first report.
+    """
+    if settings.REPORT_RENDER_POOL_SIZE <= 0:
+        return
+    pool = _acquire_pool()
+    try:
+        for _ in range(settings.REPORT_RENDER_POOL_SIZE):
+            pool.submit(_ping)
+    finally:
+        _release_pool()
+
+
+def shutdown():
+    global _pool, _idle_timer
+    with _pool_lock:
+        if _idle_timer is not None:
+            _idle_timer.cancel()
+            _idle_timer = None
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _render_parallel(tasks):
+    """
+    Run [(func, *args), ...] on the renderers and return their results in
+    order, or run them inline when the pool is disabled.
+    """
+    if settings.REPORT_RENDER_POOL_SIZE <= 0:
+        return [func(*args) for func, *args in tasks]
+
+    pool = _acquire_pool()
+    timeout = settings.REPORT_RENDER_TIMEOUT
+    try:
+        futures = [pool.submit(func, *args) for func, *args in tasks]
+        return [future.result(timeout=timeout) for future in futures]
+
+    except FutureTimeout:
+        # Other requests share the pool: give up on this render's charts only
+        logger.error("Chart rendering timed out after %ss", timeout)
+        for future in futures:
+            future.cancel()
+        raise RenderTimeout(f"Chart rendering timed out after {timeout}s")
+
+    except BrokenProcessPool:
+        logger.exception("Renderer process died; restarting renderers")
+        _discard_pool(pool)
+        raise
+
+    finally:
+        _release_pool()
+
+
+def render_report_charts(columns, fmt="png"):
+    """
+    Render the report's distribution and correlation charts.
+
+    `columns` maps flowrate / pressure / temperature to 1-D float arrays.
+    Returns (distributions, correlation) as `fmt` bytes; raises RenderTimeout
+    when the renderers don't answer within REPORT_RENDER_TIMEOUT seconds.
+    """
+    columns = {
+        name: np.ascontiguousarray(columns[name], dtype=np.float64)
+        for name, _, _ in DISTRIBUTION_STYLE
+    }
+    distributions, correlation = _render_parallel([
+        (_render_distributions, columns, fmt),
+        (_render_correlation, columns, fmt),
+    ])
+    return distributions, correlation
+
+
+def render_comparison_charts(histogram_panels, categories, share_groups):
+    """
+    Render the comparison report's overlaid histograms and type-share bars
+    (see charts.overlaid_histograms_chart / grouped_bar_chart).
+    Returns (histograms_png, types_png).
+    """
+    histograms, types = _render_parallel([
+        (charts.overlaid_histograms_chart, histogram_panels),
+        (charts.grouped_bar_chart, categories, share_groups, "Share (%)"),
+    ])
+    return histograms, types
@@ -0,0 +1,217 @@
+"""
+Background PDF report generation.
+
+A request calls `request_report(dataset)`, which finds the artifact for
+the current REPORT_TEMPLATE_VERSION or queues a render on a small thread
+pool. The job writes the PDF to default storage; finished artifacts are
+reused by every later download of the same dataset and template version.
+A failed render stays failed, with its error, until a caller asks for a
+retry. Queued plus rendering jobs are capped across all workers by the
+"report_job" admission limit; past it, requests get a 503 with Retry-After.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .models import ReportArtifact
+from .throttling import ConcurrencyLimiter, ServerBusy
+
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the layout in reports.py changes so stored artifacts are re-rendered
+REPORT_TEMPLATE_VERSION = "1"
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.REPORT_JOB_WORKERS,
+    thread_name_prefix="report-job",
+)
+
+
+def report_filename(dataset):
+    return f"dataset_{dataset.id}_report_comprehensive.pdf"
+
+
+def _job_limiter():
+    limit = settings.ADMISSION_CONCURRENCY_LIMITS.get("report_job")
+    if not limit:
+        return None
+    # A job holds its slot while queued and rendering, up to the stale cutoff
+    return ConcurrencyLimiter("report_job", limit, timeout=settings.REPORT_JOB_STALE_AFTER)
+
+
+def _run_admitted(artifact_id, limiter, slot):
+    try:
+        run_report_job(artifact_id)
+    finally:
+        if slot is not None:
+            limiter.release(slot)
+
+
+def _enqueue(artifact_id, limiter=None, slot=None):
+    transaction.on_commit(
+        lambda: _executor.submit(_run_admitted, artifact_id, limiter, slot)
+    )
+
+
+def _is_stale(artifact):
+    """
+    A pending/running job whose worker died (restart, max_requests recycle).
+    Running jobs touch updated_at every few minutes (_heartbeat), so only a
+    job nobody is working on goes stale.
+    """
+    stale_after = timedelta(seconds=settings.REPORT_JOB_STALE_AFTER)
+    return artifact.updated_at < timezone.now() - stale_after
+
+
+def _needs_render(artifact, retry):
+    if artifact_is_current(artifact):
+        return False
+    if artifact.status in (ReportArtifact.STATUS_PENDING, ReportArtifact.STATUS_RUNNING):
+        return _is_stale(artifact)
+    if artifact.status == ReportArtifact.STATUS_FAILED:
+        return retry
+    return True
+
+
+def prepare_report(dataset, retry=False):
+    """
+    Find or create the ReportArtifact for `dataset` and the current
+    template version. Returns (artifact, needs_render); needs_render is
+    True only for the caller that must run the render. A failed artifact
+    is re-queued only when `retry` is set.
+    """
+    artifact, created = ReportArtifact.objects.get_or_create(
+        dataset=dataset,
+        template_version=REPORT_TEMPLATE_VERSION,
+    )
+
+    if created:
+        return artifact, True
+
+    if not _needs_render(artifact, retry):
+        return artifact, False
+
+    # Failed, stale or missing file: reset and re-queue (only one request wins)
+    reset = ReportArtifact.objects.filter(
+        id=artifact.id,
+        updated_at=artifact.updated_at,
+    ).update(
+        status=ReportArtifact.STATUS_PENDING,
+        error="",
+        updated_at=timezone.now(),
+    )
+
+    artifact.refresh_from_db()
+    return artifact, bool(reset)
+
+
+def artifact_is_current(artifact):
+    """
+    Ready, for the current template version, and still in storage.
+    """
+    return (
+        artifact.template_version == REPORT_TEMPLATE_VERSION
+        and artifact.status == ReportArtifact.STATUS_READY
+        and bool(artifact.file)
+        and artifact.file.storage.exists(artifact.file.name)
+    )
+
+
+def request_report(dataset, retry=False):
+    """
+    Return the ReportArtifact for `dataset`, queueing a render when there
+    is no usable one yet (or, with `retry`, when the last one failed).
+    Raises ServerBusy when the job queue is full.
+    """
+    artifact = ReportArtifact.objects.filter(
+        dataset=dataset,
+        template_version=REPORT_TEMPLATE_VERSION,
+    ).first()
+    if artifact is not None and not _needs_render(artifact, retry):
+        return artifact
+
+    limiter, slot = _job_limiter(), None
+    if limiter is not None:
+        slot = limiter.acquire()
+        if slot is None:
+            raise ServerBusy(wait=settings.ADMISSION_RETRY_AFTER)
+
+    artifact, needs_render = prepare_report(dataset, retry=retry)
+    if needs_render:
+        _enqueue(artifact.id, limiter, slot)
+    elif slot is not None:
+        # Another request queued it first
+        limiter.release(slot)
+    return artifact
+
+
+def _heartbeat(artifact_id, stop):
+    """
+    Keep a running job's updated_at fresh until `stop` is set.
+    """
+    interval = settings.REPORT_JOB_STALE_AFTER / 4
+    try:
+        while not stop.wait(interval):
+            ReportArtifact.objects.filter(
+                id=artifact_id,
+                status=ReportArtifact.STATUS_RUNNING,
+            ).update(updated_at=timezone.now())
+    finally:
+        close_old_connections()
+
+
+def run_report_job(artifact_id):
+    """
+    Render one report. Runs on the job pool (or inline from commands).
+    """
+    try:
+        claimed = ReportArtifact.objects.filter(
+            id=artifact_id,
+            status=ReportArtifact.STATUS_PENDING,
+        ).update(status=ReportArtifact.STATUS_RUNNING, updated_at=timezone.now())
+
+        if not claimed:
+            return
+
+        artifact = ReportArtifact.objects.select_related("dataset__user").get(id=artifact_id)
+        dataset = artifact.dataset
+
+        stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=_heartbeat, args=(artifact_id, stop),
+            name=f"report-heartbeat-{artifact_id}", daemon=True,
+        )
+        heartbeat.start()
+        try:
+            # ReportLab and the charting stack load on the first render only
+            from .reports import load_report_frame, render_dataset_report
+
+            df = load_report_frame(dataset)
+            old_name = artifact.file.name
+            with render_dataset_report(dataset, dataset.user.username, df) as pdf:
+                # Copied to storage in chunks, never held as one bytes object
+                artifact.file.save(report_filename(dataset), File(pdf), save=False)
+            if old_name and old_name != artifact.file.name:
+                artifact.file.storage.delete(old_name)
+
+            artifact.status = ReportArtifact.STATUS_READY
+            artifact.error = ""
+            artifact.completed_at = timezone.now()
+        except Exception as e:
+            logger.exception("Report job %s failed", artifact_id)
+            artifact.status = ReportArtifact.STATUS_FAILED
+            artifact.error = str(e)
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        artifact.save()
+    finally:
+        close_old_connections()
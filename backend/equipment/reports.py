@@ -0,0 +1,397 @@
+import tempfile
+from io import BytesIO
+
+from django.conf import settings
+from django.utils import timezone
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import (
+    SimpleDocTemplate,
+    Paragraph,
+    Spacer,
+    Table,
+    TableStyle,
+    PageBreak,
+    Image,
+)
+
+from . import render_pool
+from .data_access import load_dataset_columns
+
+
+def load_report_frame(dataset):
+    """
+    DataFrame with the columns the report needs.
+    """
+    return load_dataset_columns(dataset).to_frame()
+
+
+# --------------------------------------------------
+# 🔹 Dataset PDF Report (Advanced Charts Edition)
+# --------------------------------------------------
+def build_dataset_report(output, dataset, username, df):
+    """
+    Render the comprehensive PDF report for `dataset` into `output`
+    (any writable file-like object).
+    `df` holds the flowrate, pressure, temperature and equipment_type columns.
+    """
+    doc = SimpleDocTemplate(
+        output,
+        pagesize=A4,
+        rightMargin=40,
+        leftMargin=40,
+        topMargin=40,
+        bottomMargin=40,
+    )
+
+    styles = getSampleStyleSheet()
+    # Custom Styles
+    styles.add(ParagraphStyle(name='CoverTitle', parent=styles['Title'], fontSize=28, spaceAfter=20, textColor=colors.darkblue))
+    styles.add(ParagraphStyle(name='CoverSub', parent=styles['Normal'], fontSize=14, alignment=1, spaceAfter=6, textColor=colors.gray))
+
+    elements = []
+
+    # ==========================================================
+    # 1. COVER PAGE
+    # ==========================================================
+    elements.append(Spacer(1, 100))
+    elements.append(Paragraph("EQUIPMENT ANALYTICS", styles["CoverSub"]))
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("Comprehensive Dataset Analysis Report", styles["CoverTitle"]))
+    elements.append(Spacer(1, 20))
+
+    # Metadata Box
+    meta_data = [
+        ["Dataset Name:", dataset.name],
+        ["Dataset ID:", str(dataset.id)],
+        ["Uploaded By:", username],
+        ["Generated Date:", timezone.now().strftime('%B %d, %Y')],
+        ["Total Records:", str(len(df))],
+    ]
+    meta_table = Table(meta_data, colWidths=[120, 300])
+    meta_table.setStyle(TableStyle([
+        ('FONT', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONT', (1, 0), (1, -1), 'Helvetica'),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.darkslategray),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ]))
+    elements.append(meta_table)
+    elements.append(Spacer(1, 150))
+
+    elements.append(Paragraph("CONFIDENTIAL", styles["CoverSub"]))
+    elements.append(PageBreak())
+
+    # ==========================================================
+    # 2. STATISTICAL SUMMARY
+    # ==========================================================
+    elements.append(Paragraph("1. Statistical Executive Summary", styles["Heading1"]))
+    elements.append(Spacer(1, 12))
+    elements.append(Paragraph("Descriptive statistics for key operational metrics (Flowrate, Pressure, Temperature).", styles["Normal"]))
+    elements.append(Spacer(1, 12))
+
+    # Compute Describe
+    desc = df[["flowrate", "pressure", "temperature"]].describe().round(2).reset_index()
+    # Rename columns for display
+    desc_data = [["Statistic", "Flowrate (m³/h)", "Pressure (Pa)", "Temperature (°C)"]]
+    for _, row in desc.iterrows():
+        stat_name = row['index'].capitalize()
+        if stat_name == "Count": stat_name = "Total Count"
+        desc_data.append([stat_name, row['flowrate'], row['pressure'], row['temperature']])
+
+    stat_table = Table(desc_data, colWidths=[120, 120, 120, 120])
+    stat_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+
+        ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.whitesmoke, colors.aliceblue]),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ]))
+    elements.append(stat_table)
+    elements.append(Spacer(1, 24))
+
+    # Group by Equipment Type
+    elements.append(Paragraph("Breakdown by Equipment Type", styles["Heading2"]))
+    type_counts = df["equipment_type"].value_counts().reset_index()
+    type_counts.columns = ["Type", "Count"]
+
+    type_data = [["Equipment Type", "Count", "% Share"]]
+    total = len(df)
+    for _, row in type_counts.iterrows():
+        share = (row['Count'] / total) * 100
+        type_data.append([row['Type'], row['Count'], f"{share:.1f}%"])
+
+    type_table = Table(type_data, colWidths=[200, 100, 100], hAlign='LEFT')
+    type_table.setStyle(TableStyle([
+         ('BACKGROUND', (0, 0), (-1, 0), colors.black),
+         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+         ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
+    ]))
+    elements.append(type_table)
+    elements.append(PageBreak())
+
+    # ==========================================================
+    # 3. ADVANCED VISUALIZATIONS
+    # ==========================================================
+    elements.append(Paragraph("2. Visual Analytics", styles["Heading1"]))
+    elements.append(Spacer(1, 12))
+
+    # Rendered in the pre-warmed renderer processes (see render_pool.py)
+    distributions_png, correlation_png = render_pool.render_report_charts({
+        name: df[name].to_numpy(dtype=float) for name in ("flowrate", "pressure", "temperature")
+    })
+
+    # -- A. DISTRIBUTION HISTOGRAMS --
+    elements.append(Paragraph("A. Metric Distributions", styles["Heading2"]))
+
+    # Add Image to PDF
+    img = Image(BytesIO(distributions_png), width=480, height=160)
+    elements.append(img)
+    elements.append(Spacer(1, 20))
+
+    # -- B. CORRELATION HEATMAP --
+    elements.append(Paragraph("B. Correlation Matrix", styles["Heading2"]))
+    elements.append(Paragraph("Analyzes the linear relationship between variables. (1.0 = Perfect Positive, -1.0 = Perfect Negative)", styles["Normal"]))
+    elements.append(Spacer(1, 10))
+
+    img2 = Image(BytesIO(correlation_png), width=400, height=250)
+    elements.append(img2)
+    elements.append(PageBreak())
+
+    # ==========================================================
+    # 4. RAW DATA SAMPLE
+    # ==========================================================
+    elements.append(Paragraph("3. Raw Data Sample (First 20 Rows)", styles["Heading1"]))
+    elements.append(Spacer(1, 10))
+
+    raw_data = [["Name", "Type", "Flow", "Pres", "Temp"]]
+    for _, row in df.head(20).iterrows():
+        raw_data.append([
+            row['equipment_type'][:15], # Truncate if long
+            row['equipment_type'],
+            f"{row['flowrate']:.1f}",
+            f"{row['pressure']:.1f}",
+            f"{row['temperature']:.1f}",
+        ])
+
+    raw_table = Table(raw_data, colWidths=[100, 100, 80, 80, 80])
+    raw_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ]))
+    elements.append(raw_table)
+
+    # Footer Function
+    def add_footer(canvas, doc):
+        canvas.saveState()
+        canvas.setFont("Helvetica", 9)
+        canvas.drawString(40, 30, "Generated by Equipment Analytics")
+        canvas.drawRightString(A4[0]-40, 30, f"Page {doc.page} | Confidential")
+        canvas.restoreState()
+
+    doc.build(elements, onFirstPage=add_footer, onLaterPages=add_footer)
+
+
+def spooled_output():
+    """
+    Output file for a PDF: kept in memory up to REPORT_SPOOL_MAX_MEMORY
+    bytes, then rolled over to a temporary file on disk.
+    """
+    return tempfile.SpooledTemporaryFile(max_size=settings.REPORT_SPOOL_MAX_MEMORY)
+
+
+def render_dataset_report(dataset, username, df):
+    """
+    Render the report into a spooled file, rewound and ready to read.
+    The caller closes it.
+    """
+    output = spooled_output()
+    build_dataset_report(output, dataset, username, df)
+    output.seek(0)
+    return output
+
+
+# --------------------------------------------------
+# 🔹 Dataset Comparison Report (stored aggregates only)
+# --------------------------------------------------
+COMPARE_COLORS = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b"]
+COMPARE_METRICS = [
+    ("flowrate", "Flowrate (m³/h)"),
+    ("pressure", "Pressure (Pa)"),
+    ("temperature", "Temperature (°C)"),
+]
+COMPARE_STATISTICS = [
+    ("mean", "Mean"),
+    ("std", "Std. Dev."),
+    ("min", "Min"),
+    ("25%", "25%"),
+    ("50%", "Median"),
+    ("75%", "75%"),
+    ("max", "Max"),
+]
+
+
+def _short(text, length=18):
+    return text if len(text) <= length else text[:length - 1] + "…"
+
+
+def _format_stat(value):
+    return "-" if value is None else f"{value:,.2f}"
+
+
+def build_comparison_report(output, datasets, username):
+    """
+    Render a side-by-side PDF for several datasets into `output`.
+    Reads only the aggregates stored on each Dataset (see aggregates.py),
+    never the Equipment rows.
+    """
+    doc = SimpleDocTemplate(
+        output,
+        pagesize=A4,
+        rightMargin=40,
+        leftMargin=40,
+        topMargin=40,
+        bottomMargin=40,
+    )
+    styles = getSampleStyleSheet()
+    elements = []
+
+    labels = [f"#{dataset.id} {_short(dataset.name)}" for dataset in datasets]
+    colors_by_dataset = [COMPARE_COLORS[i % len(COMPARE_COLORS)] for i in range(len(datasets))]
+
+    header_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.whitesmoke, colors.aliceblue]),
+    ])
+    label_width = 95
+    column_width = (A4[0] - 80 - label_width) / len(datasets)
+    column_widths = [label_width] + [column_width] * len(datasets)
+    header = [""] + [Paragraph(f"<b>{label}</b>", styles["Normal"]) for label in labels]
+
+    # ==========================================================
+    # 1. OVERVIEW
+    # ==========================================================
+    elements.append(Paragraph("Dataset Comparison Report", styles["Title"]))
+    elements.append(Paragraph(
+        f"Generated for {username} on {timezone.now().strftime('%B %d, %Y')}",
+        styles["Normal"],
+    ))
+    elements.append(Spacer(1, 16))
+
+    overview = [["Dataset", "Name", "Uploaded", "Records"]]
+    for dataset in datasets:
+        overview.append([
+            f"#{dataset.id}",
+            _short(dataset.name, 40),
+            dataset.uploaded_at.strftime('%Y-%m-%d %H:%M'),
+            str(dataset.summary_total),
+        ])
+    overview_table = Table(overview, colWidths=[60, 235, 120, 100])
+    overview_table.setStyle(header_style)
+    elements.append(overview_table)
+    elements.append(Spacer(1, 20))
+
+    # ==========================================================
+    # 2. SIDE-BY-SIDE STATISTICS
+    # ==========================================================
+    elements.append(Paragraph("1. Statistics", styles["Heading1"]))
+    for metric, title in COMPARE_METRICS:
+        elements.append(Paragraph(title, styles["Heading3"]))
+        rows = [header]
+        for key, name in COMPARE_STATISTICS:
+            rows.append([name] + [
+                _format_stat(dataset.summary_stats["statistics"][metric].get(key))
+                for dataset in datasets
+            ])
+        table = Table(rows, colWidths=column_widths)
+        table.setStyle(header_style)
+        elements.append(table)
+        elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+
+    # ==========================================================
+    # 3. TYPE DISTRIBUTIONS
+    # ==========================================================
+    elements.append(Paragraph("2. Equipment Type Distribution", styles["Heading1"]))
+    elements.append(Spacer(1, 8))
+
+    types = sorted({
+        name for dataset in datasets for name in dataset.summary_type_distribution
+    })
+    shares = []
+    for dataset in datasets:
+        total = dataset.summary_total or 1
+        shares.append([
+            dataset.summary_type_distribution.get(name, 0) * 100 / total for name in types
+        ])
+
+    rows = [header]
+    for i, name in enumerate(types):
+        rows.append([_short(name)] + [
+            f"{dataset.summary_type_distribution.get(name, 0)} ({share[i]:.1f}%)"
+            for dataset, share in zip(datasets, shares)
+        ])
+    type_table = Table(rows, colWidths=column_widths)
+    type_table.setStyle(header_style)
+    elements.append(type_table)
+    elements.append(Spacer(1, 16))
+
+    # Rendered in the pre-warmed renderer processes (see render_pool.py)
+    histograms_png, types_png = render_pool.render_comparison_charts(
+        [
+            (title, metric, [
+                (
+                    label,
+                    color,
+                    dataset.summary_histograms[metric]["edges"],
+                    dataset.summary_histograms[metric]["counts"],
+                )
+                for dataset, label, color in zip(datasets, labels, colors_by_dataset)
+            ])
+            for metric, title in COMPARE_METRICS
+        ],
+        types,
+        list(zip(labels, colors_by_dataset, shares)),
+    )
+
+    elements.append(Image(BytesIO(types_png), width=440, height=192))
+    elements.append(PageBreak())
+
+    # ==========================================================
+    # 4. OVERLAID HISTOGRAMS
+    # ==========================================================
+    elements.append(Paragraph("3. Metric Distributions", styles["Heading1"]))
+    elements.append(Paragraph(
+        "Stored histograms of each dataset, normalized to density so datasets of different sizes are comparable.",
+        styles["Normal"],
+    ))
+    elements.append(Spacer(1, 10))
+    elements.append(Image(BytesIO(histograms_png), width=500, height=190))
+
+    doc.build(elements)
+
+
+def render_comparison_report(datasets, username):
+    """
+    Render the comparison report into a spooled file, rewound and ready
+    to read. The caller closes it.
+    """
+    output = spooled_output()
+    build_comparison_report(output, datasets, username)
+    output.seek(0)
+    return output
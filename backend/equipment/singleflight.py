@@ -0,0 +1,105 @@
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+_MISSING = object()
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical computations.
+
+    Within a worker, threads asking for the same key wait on the first
+    caller. Across workers (only when SINGLE_FLIGHT_CACHE_ALIAS names a
+    shared cache), the first caller takes a lock in that cache and hands
+    its result to the callers already waiting on that lock; they poll for
+    it instead of recomputing. Callers that arrive after a flight ends
+    start a new one, so results are never served stale.
+
+        report_flight = SingleFlight("report")
+        pdf = report_flight.do(dataset.id, lambda: render(dataset))
+
+    Results must be picklable.
+    """
+
+    poll_interval = 0.1
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        alias = settings.SINGLE_FLIGHT_CACHE_ALIAS
+        return caches[alias] if alias else None
+
+    def do(self, key, func):
+        key = f"singleflight:{self.namespace}:{key}"
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func() if self.cache is None else self._do_shared(key, func)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+        return call.result
+
+    def _do_shared(self, key, func):
+        cache = self.cache
+        lock_key = f"{key}:lock"
+
+        owner = uuid.uuid4().hex
+        deadline = time.monotonic() + settings.SINGLE_FLIGHT_WAIT_TIMEOUT
+        flight = None
+
+        while True:
+            if cache.add(lock_key, owner, settings.SINGLE_FLIGHT_LOCK_TIMEOUT):
+                try:
+                    result = func()
+                    # Keyed by this flight, so only callers already waiting read it
+                    cache.set(f"{key}:result:{owner}", result, settings.SINGLE_FLIGHT_RESULT_TTL)
+                    return result
+                finally:
+                    if cache.get(lock_key) == owner:
+                        cache.delete(lock_key)
+
+            # Another worker is computing it
+            flight = cache.get(lock_key) or flight
+            time.sleep(self.poll_interval)
+
+            if flight is not None:
+                result = cache.get(f"{key}:result:{flight}", _MISSING)
+                if result is not _MISSING:
+                    return result
+
+            if time.monotonic() > deadline:
+                # Give up waiting on a stuck or slow leader
+                return func()
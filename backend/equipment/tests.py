@@ -0,0 +1,110 @@
+import io
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from .models import Dataset, Equipment
+from .throttling import ConcurrencyLimiter
+
+
+class ReportStatusURLTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user("alice", password="pw12345xyz")
+        self.dataset = Dataset.objects.create(user=user, name="a.csv")
+        Equipment.objects.create(
+            dataset=self.dataset, equipment_name="P-1", equipment_type="Pump",
+            flowrate=10, pressure=2, temperature=90,
+        )
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + Token.objects.create(user=user).key)
+
+    def test_urls_follow_the_proxy_scheme_and_host(self):
+        # Render terminates TLS and forwards plain HTTP with these headers
+        response = self.client.post(
+            f"/api/report/{self.dataset.id}/",
+            HTTP_X_FORWARDED_PROTO="https",
+            HTTP_X_FORWARDED_HOST="api.example.com",
+        )
+
+        self.assertEqual(response.status_code, 202)
+        prefix = f"https://api.example.com/api/report/{self.dataset.id}/"
+        self.assertEqual(response.data["status_url"], prefix + "status/")
+        self.assertEqual(response.data["download_url"], prefix)
+        self.assertEqual(response["Location"], prefix + "status/")
+
+    def test_urls_without_a_proxy(self):
+        response = self.client.post(f"/api/report/{self.dataset.id}/")
+
+        self.assertEqual(
+            response.data["status_url"],
+            f"http://testserver/api/report/{self.dataset.id}/status/",
+        )
+
+
+class LegacyAggregatesTests(TestCase):
+    """
+    Datasets uploaded before the aggregates were stored: request paths
+    never compute them, backfill_aggregates does.
+    """
+
+    def setUp(self):
+        user = User.objects.create_user("bob", password="pw12345xyz")
+        self.datasets = []
+        for name in ("a.csv", "b.csv"):
+            dataset = Dataset.objects.create(user=user, name=name)
+            Equipment.objects.create(
+                dataset=dataset, equipment_name="P-1", equipment_type="Pump",
+                flowrate=10, pressure=2, temperature=90,
+            )
+            self.datasets.append(dataset)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + Token.objects.create(user=user).key)
+
+    def test_requests_fall_back_without_backfilling(self):
+        history = self.client.get("/api/history/?page=1")
+        self.assertEqual([row["summary"] for row in history.data["results"]], [None, None])
+
+        ids = ",".join(str(dataset.id) for dataset in self.datasets)
+        compare = self.client.get(f"/api/report/compare/?ids={ids}")
+        self.assertEqual(compare.status_code, 409)
+        self.assertEqual(compare.data["pending_ids"], [dataset.id for dataset in self.datasets])
+
+        html = self.client.get(f"/api/report/{self.datasets[0].id}/html/")
+        self.assertEqual(html.status_code, 409)
+
+        self.assertFalse(Dataset.objects.filter(summary_histograms__isnull=False).exists())
+
+    def test_backfill_command(self):
+        call_command("backfill_aggregates", stdout=io.StringIO())
+
+        for dataset in Dataset.objects.all():
+            self.assertEqual(dataset.summary_total, 1)
+            self.assertIsNotNone(dataset.summary_histograms)
+
+        history = self.client.get("/api/history/?page=1")
+        self.assertEqual(history.data["results"][0]["summary"]["total_equipment"], 1)
+
+
+class HTMLReportAdmissionTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user("carol", password="pw12345xyz")
+        self.dataset = Dataset.objects.create(user=user, name="a.csv", summary_total=1)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + Token.objects.create(user=user).key)
+
+    def test_busy_when_every_report_slot_is_taken(self):
+        limiter = ConcurrencyLimiter("report", settings.ADMISSION_CONCURRENCY_LIMITS["report"])
+        slots = [limiter.acquire() for _ in range(limiter.limit)]
+        try:
+            response = self.client.get(f"/api/report/{self.dataset.id}/html/")
+        finally:
+            for slot in slots:
+                limiter.release(slot)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], str(settings.ADMISSION_RETRY_AFTER))
@@ -0,0 +1,107 @@
+from django.conf import settings
+from django.core.cache import caches
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.throttling import ScopedRateThrottle
+
+
+def shared_cache():
+    """
+    Cache shared by every worker process (Redis or the database cache table).
+    """
+    return caches[settings.ADMISSION_CACHE_ALIAS]
+
+
+class ServerBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Server is busy, please retry shortly."
+    default_code = "server_busy"
+
+    def __init__(self, wait=None, detail=None, code=None):
+        super().__init__(detail, code)
+        # DRF's exception handler turns `wait` into a Retry-After header
+        self.wait = wait
+
+
+# --------------------------------------------------
+# 🔹 Per-user rate throttle (shared across workers)
+# --------------------------------------------------
+class SharedScopedRateThrottle(ScopedRateThrottle):
+    """
+    ScopedRateThrottle whose request history lives in the shared cache,
+    so a user's rate holds across every gunicorn worker.
+    Responds 429 with Retry-After when exceeded.
+    """
+
+    def __init__(self):
+        self.cache = shared_cache()
+        super().__init__()
+
+
+# --------------------------------------------------
+# 🔹 Concurrency limiter
+# --------------------------------------------------
+class ConcurrencyLimiter:
+    """
+    Cross-process semaphore made of `limit` slot keys in the shared cache.
+
+    cache.add() is atomic on both Redis and the database cache, so a slot
+    can only be held by one request. Slots expire after `timeout` seconds
+    (ADMISSION_SLOT_TIMEOUT by default) so a crashed worker cannot leak them.
+    """
+
+    def __init__(self, scope, limit, timeout=None):
+        self.scope = scope
+        self.limit = limit
+        self.timeout = timeout or settings.ADMISSION_SLOT_TIMEOUT
+        self.cache = shared_cache()
+
+    def _slot_key(self, index):
+        return f"admission:{self.scope}:slot:{index}"
+
+    def acquire(self):
+        """
+        Returns the acquired slot key, or None when all slots are taken.
+        """
+        for index in range(self.limit):
+            key = self._slot_key(index)
+            if self.cache.add(key, 1, self.timeout):
+                return key
+        return None
+
+    def release(self, key):
+        self.cache.delete(key)
+
+
+class AdmissionControlMixin:
+    """
+    APIView mixin for expensive endpoints.
+
+    Set `throttle_scope` to apply the per-user rate from
+    DEFAULT_THROTTLE_RATES, and `admission_scope` to cap concurrent
+    requests using ADMISSION_CONCURRENCY_LIMITS.
+    """
+
+    admission_scope = None
+    throttle_classes = [SharedScopedRateThrottle]
+
+    def initial(self, request, *args, **kwargs):
+        self._admission_slot = None
+        # Authentication, permissions and rate throttles run first
+        super().initial(request, *args, **kwargs)
+
+        limit = settings.ADMISSION_CONCURRENCY_LIMITS.get(self.admission_scope)
+        if not limit:
+            return
+
+        self._admission_limiter = ConcurrencyLimiter(self.admission_scope, limit)
+        self._admission_slot = self._admission_limiter.acquire()
+        if self._admission_slot is None:
+            raise ServerBusy(wait=settings.ADMISSION_RETRY_AFTER)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if getattr(self, "_admission_slot", None) is not None:
+            self._admission_limiter.release(self._admission_slot)
+            self._admission_slot = None
+        return super().finalize_response(request, response, *args, **kwargs)
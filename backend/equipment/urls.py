@@ -1,11 +1,14 @@
 from django.urls import path
-from .views import DatasetScatterView
+from .views import DatasetScatterView, DatasetStatsView
 
 from .views import (
     CSVUploadView,
     DatasetSummaryView,
     DatasetHistoryView,
     DatasetReportPDFView,
+    DatasetReportStatusView,
+    DatasetCompareReportView,
+    DatasetReportHTMLView,
 )
 
 urlpatterns = [
@@ -30,16 +33,42 @@ urlpatterns = [
         name="dataset-history",
     ),
 
-    # 📄 PDF report generation
+    # 📄 Comparison PDF for several datasets (?ids=1,2,3)
+    path(
+        "report/compare/",
+        DatasetCompareReportView.as_view(),
+        name="dataset-compare-report",
+    ),
+
+    # 📄 PDF report generation (GET downloads or queues, POST queues)
     path(
         "report/<int:dataset_id>/",
         DatasetReportPDFView.as_view(),
         name="dataset-pdf-report",
     ),
 
+    # 🌐 HTML report for in-browser viewing
+    path(
+        "report/<int:dataset_id>/html/",
+        DatasetReportHTMLView.as_view(),
+        name="dataset-html-report",
+    ),
+
+    path(
+        "report/<int:dataset_id>/status/",
+        DatasetReportStatusView.as_view(),
+        name="dataset-pdf-report-status",
+    ),
+
        path(
         "datasets/<int:dataset_id>/scatter/",
         DatasetScatterView.as_view(),
         name="dataset-scatter",
     ),
+
+    path(
+        "datasets/<int:dataset_id>/stats/",
+        DatasetStatsView.as_view(),
+        name="dataset-stats",
+    ),
 ]
@@ -1,28 +1,41 @@
-import pandas as pd
+import functools
+import random
 
-from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.shortcuts import get_object_or_404, render
 from django.utils import timezone
 from django.db import models
-from django.http import HttpResponse
+from django.urls import reverse
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import ValidationError
-
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
-
-from .models import Dataset, Equipment
-from .serializers import (
-    DatasetSummarySerializer,
-    EquipmentScatterSerializer,
+from rest_framework.pagination import PageNumberPagination
+
+from .aggregates import (
+    NUMERIC_COLUMNS,
+    build_dataset_stats,
+    has_stored_aggregates,
+    store_dataset_aggregates,
+    stored_summary,
 )
-
+from .data_access import load_dataset_columns
+from .file_serving import ranged_file_response, spooled_file_response
+from .lazy_imports import pandas
+from .models import Dataset, Equipment, ReportArtifact
+from .serializers import DatasetSummarySerializer
+from .report_jobs import REPORT_TEMPLATE_VERSION, report_filename, request_report
+from .singleflight import SingleFlight
+from .throttling import AdmissionControlMixin
 from .validators import validate_equipment_row
 
 
+stats_flight = SingleFlight("stats")
+scatter_flight = SingleFlight("scatter")
+
+
 # --------------------------------------------------
 # 🔹 Helper function
 # --------------------------------------------------
@@ -46,11 +59,83 @@ def build_dataset_summary(equipments):
     }
 
 
+def compute_dataset_stats(dataset):
+    return build_dataset_stats(load_dataset_columns(dataset).to_frame())
+
+
+def parse_max_points(value):
+    """
+    Parse the optional ?max_points= scatter parameter.
+    """
+    if value in (None, ""):
+        return None
+
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError({"max_points": "max_points must be a positive integer."})
+
+    if value <= 0:
+        raise ValidationError({"max_points": "max_points must be a positive integer."})
+
+    return value
+
+
+def parse_dataset_ids(value):
+    """
+    Parse the ?ids=1,2,3 parameter of the comparison report (order kept,
+    duplicates dropped).
+    """
+    try:
+        ids = [int(part) for part in (value or "").split(",") if part.strip()]
+    except ValueError:
+        raise ValidationError({"ids": "ids must be a comma-separated list of dataset ids."})
+
+    return list(dict.fromkeys(ids))
+
+
+def build_scatter_points(dataset, max_points=None):
+    """
+    Scatter points (x = temperature, y = pressure) for a dataset.
+    With max_points, a reproducible uniform sample of at most that many points.
+    """
+    columns = load_dataset_columns(dataset)
+    total = len(columns)
+
+    if max_points is not None and total > max_points:
+        picked = sorted(random.Random(dataset.id).sample(range(total), max_points))
+    else:
+        picked = slice(None)
+
+    names = columns.type_names
+    return {
+        "total_points": total,
+        "points": [
+            {"x": x, "y": y, "flowrate": flowrate, "equipment_type": names[code]}
+            for x, y, flowrate, code in zip(
+                columns.numeric["temperature"][picked].tolist(),
+                columns.numeric["pressure"][picked].tolist(),
+                columns.numeric["flowrate"][picked].tolist(),
+                columns.type_codes[picked].tolist(),
+            )
+        ],
+    }
+
+
+def cached_scatter_points(dataset, max_points=None):
+    return scatter_flight.do(
+        f"{dataset.id}:{max_points}",
+        lambda: build_scatter_points(dataset, max_points),
+    )
+
+
 # --------------------------------------------------
 # 🔹 CSV Upload
 # --------------------------------------------------
-class CSVUploadView(APIView):
+class CSVUploadView(AdmissionControlMixin, APIView):
     permission_classes = [IsAuthenticated]
+    throttle_scope = "upload"
+    admission_scope = "upload"
     MAX_ROWS = 25_000
 
     def post(self, request):
@@ -63,7 +148,7 @@ class CSVUploadView(APIView):
             )
 
         try:
-            df = pd.read_csv(file)
+            df = pandas().read_csv(file)
         except Exception:
             return Response(
                 {"error": "Unable to read CSV file."},
@@ -142,6 +227,9 @@ class CSVUploadView(APIView):
             except ValidationError as e:
                 errors.append({"row": index + 1, "errors": e.detail})
 
+        # Summary, statistics and histograms are stored once here
+        store_dataset_aggregates(dataset)
+
         return Response(
             {
                 "dataset_id": dataset.id,
@@ -202,12 +290,13 @@ class DatasetScatterView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = EquipmentScatterSerializer(equipments, many=True)
+        max_points = parse_max_points(request.query_params.get("max_points"))
+        scatter = cached_scatter_points(dataset, max_points)
 
         return Response(
             {
                 "dataset_id": dataset.id,
-                "points": serializer.data,
+                **scatter,
             },
             status=status.HTTP_200_OK,
         )
@@ -215,13 +304,52 @@ class DatasetScatterView(APIView):
 
 
 
+# --------------------------------------------------
+# 🔹 Descriptive Statistics
+# --------------------------------------------------
+class DatasetStatsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, dataset_id):
+        dataset = get_object_or_404(
+            Dataset,
+            id=dataset_id,
+            user=request.user,
+        )
+
+        equipments = Equipment.objects.filter(dataset=dataset)
+
+        if not equipments.exists():
+            return Response(
+                {"error": "No equipment data available."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        stats = stats_flight.do(dataset.id, lambda: compute_dataset_stats(dataset))
+
+        return Response(
+            {"dataset_id": dataset.id, **stats},
+            status=status.HTTP_200_OK,
+        )
+
+
 # --------------------------------------------------
 # 🔹 Last 5 Dataset Summaries
 # --------------------------------------------------
+class HistoryPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
 class DatasetHistoryView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
+        # ?page=N: every dataset, a page at a time (desktop dashboard)
+        if "page" in request.query_params:
+            return self.get_page(request)
+
         datasets = (
             Dataset.objects.filter(user=request.user)
             .order_by("-uploaded_at")[:5]
@@ -248,25 +376,77 @@ class DatasetHistoryView(APIView):
 
         return Response(response, status=status.HTTP_200_OK)
 
+    def get_page(self, request):
+        """
+        Summaries come from the stored aggregates, so a page costs a fixed
+        two queries (count, rows) however many datasets the user has.
+        Uploads that predate the stored summary are listed with summary
+        None until backfill_aggregates has run.
+        """
+        datasets = (
+            Dataset.objects.filter(user=request.user)
+            .exclude(summary_total=0)
+            .defer("summary_stats", "summary_histograms")
+            .order_by("-uploaded_at", "-id")
+        )
+
+        paginator = HistoryPagination()
+        page = paginator.paginate_queryset(datasets, request, view=self)
+
+        return paginator.get_paginated_response(
+            [
+                {
+                    "dataset_id": dataset.id,
+                    "dataset_name": dataset.name,
+                    "uploaded_at": dataset.uploaded_at,
+                    "summary": (
+                        stored_summary(dataset)
+                        if dataset.summary_total is not None
+                        else None
+                    ),
+                }
+                for dataset in page
+            ]
+        )
+
 
 # --------------------------------------------------
-# 🔹 Dataset PDF Report (Advanced Charts Edition)
+# 🔹 Dataset PDF Report (background job + stored artifact)
 # --------------------------------------------------
-from reportlab.platypus import (
-    SimpleDocTemplate,
-    Paragraph,
-    Spacer,
-    Table,
-    TableStyle,
-    PageBreak,
-)
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
+def report_status_response(request, dataset, artifact):
+    """
+    Job status payload: 202 while queued or rendering, 200 once ready or failed.
+    """
+    status_url = request.build_absolute_uri(
+        reverse("dataset-pdf-report-status", args=[dataset.id])
+    )
+    payload = {
+        "dataset_id": dataset.id,
+        "status": artifact.status,
+        "template_version": artifact.template_version,
+        "requested_at": artifact.created_at,
+        "completed_at": artifact.completed_at,
+        "error": artifact.error or None,
+        "status_url": status_url,
+        "download_url": request.build_absolute_uri(
+            reverse("dataset-pdf-report", args=[dataset.id])
+        ),
+    }
+
+    if artifact.status in (ReportArtifact.STATUS_READY, ReportArtifact.STATUS_FAILED):
+        return Response(payload, status=status.HTTP_200_OK)
 
+    return Response(
+        payload,
+        status=status.HTTP_202_ACCEPTED,
+        headers={"Location": status_url, "Retry-After": "2"},
+    )
 
-class DatasetReportPDFView(APIView):
+
+class DatasetReportPDFView(AdmissionControlMixin, APIView):
     permission_classes = [IsAuthenticated]
+    throttle_scope = "report"
+    admission_scope = "report"
 
     def get(self, request, dataset_id):
         dataset = get_object_or_404(
@@ -283,199 +463,231 @@ class DatasetReportPDFView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # Create DataFrame for analysis
-        df = pd.DataFrame(list(equipments.values("flowrate", "pressure", "temperature", "equipment_type")))
-        
-        response = HttpResponse(content_type="application/pdf")
-        response["Content-Disposition"] = f'attachment; filename="dataset_{dataset.id}_report_comprehensive.pdf"'
-
-        doc = SimpleDocTemplate(
-            response,
-            pagesize=A4,
-            rightMargin=40,
-            leftMargin=40,
-            topMargin=40,
-            bottomMargin=40,
+        # A failed render is reported, not silently re-queued, unless asked
+        artifact = request_report(dataset, retry=request.query_params.get("retry") == "1")
+
+        if artifact.status == ReportArtifact.STATUS_READY:
+            # Stored file: Content-Length, Range resume, sendfile where available
+            return ranged_file_response(
+                request,
+                artifact.file,
+                filename=report_filename(dataset),
+                content_type="application/pdf",
+                etag=f'"report-{artifact.id}-{artifact.completed_at.timestamp():.0f}"',
+                last_modified=artifact.completed_at,
+            )
+
+        response = report_status_response(request, dataset, artifact)
+        if artifact.status == ReportArtifact.STATUS_FAILED:
+            # Never a 200 from the download URL without a PDF
+            response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        return response
+
+    def post(self, request, dataset_id):
+        dataset = get_object_or_404(
+            Dataset,
+            id=dataset_id,
+            user=request.user,
         )
 
-        styles = getSampleStyleSheet()
-        # Custom Styles
-        styles.add(ParagraphStyle(name='CoverTitle', parent=styles['Title'], fontSize=28, spaceAfter=20, textColor=colors.darkblue))
-        styles.add(ParagraphStyle(name='CoverSub', parent=styles['Normal'], fontSize=14, alignment=1, spaceAfter=6, textColor=colors.gray))
-        
-        elements = []
-
-        # ==========================================================
-        # 1. COVER PAGE
-        # ==========================================================
-        elements.append(Spacer(1, 100))
-        elements.append(Paragraph("EQUIPMENT ANALYTICS", styles["CoverSub"]))
-        elements.append(Spacer(1, 20))
-        elements.append(Paragraph("Comprehensive Dataset Analysis Report", styles["CoverTitle"]))
-        elements.append(Spacer(1, 20))
-        
-        # Metadata Box
-        meta_data = [
-            ["Dataset Name:", dataset.name],
-            ["Dataset ID:", str(dataset.id)],
-            ["Uploaded By:", request.user.username],
-            ["Generated Date:", timezone.now().strftime('%B %d, %Y')],
-            ["Total Records:", str(len(df))],
+        if not Equipment.objects.filter(dataset=dataset).exists():
+            return Response(
+                {"error": "No equipment data available."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        artifact = request_report(dataset, retry=True)
+        return report_status_response(request, dataset, artifact)
+
+
+class DatasetReportStatusView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, dataset_id):
+        dataset = get_object_or_404(
+            Dataset,
+            id=dataset_id,
+            user=request.user,
+        )
+
+        artifact = ReportArtifact.objects.filter(
+            dataset=dataset,
+            template_version=REPORT_TEMPLATE_VERSION,
+        ).first()
+
+        if artifact is None:
+            return Response(
+                {"error": "No report has been requested for this dataset."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return report_status_response(request, dataset, artifact)
+
+
+# --------------------------------------------------
+# 🔹 Multi-Dataset Comparison Report (from stored aggregates)
+# --------------------------------------------------
+class DatasetCompareReportView(AdmissionControlMixin, APIView):
+    permission_classes = [IsAuthenticated]
+    throttle_scope = "report"
+    admission_scope = "report"
+    MIN_DATASETS = 2
+    MAX_DATASETS = 6
+
+    def get(self, request):
+        ids = parse_dataset_ids(request.query_params.get("ids"))
+
+        if not self.MIN_DATASETS <= len(ids) <= self.MAX_DATASETS:
+            return Response(
+                {
+                    "error": f"Select between {self.MIN_DATASETS} and {self.MAX_DATASETS} datasets to compare.",
+                    "received": len(ids),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        found = Dataset.objects.filter(id__in=ids, user=request.user).in_bulk()
+        missing = [dataset_id for dataset_id in ids if dataset_id not in found]
+
+        if missing:
+            return Response(
+                {"error": "Dataset not found.", "missing_ids": missing},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        datasets = [found[dataset_id] for dataset_id in ids]
+
+        # Aggregates of older uploads come from backfill_aggregates, not here
+        pending = [dataset.id for dataset in datasets if not has_stored_aggregates(dataset)]
+        if pending:
+            return Response(
+                {
+                    "error": "Statistics for these datasets are not available yet.",
+                    "pending_ids": pending,
+                },
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        empty = [dataset.id for dataset in datasets if not dataset.summary_total]
+
+        if empty:
+            return Response(
+                {"error": "No equipment data available.", "empty_ids": empty},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # ReportLab loads on the first report only
+        from .reports import render_comparison_report
+
+        output = render_comparison_report(datasets, request.user.username)
+
+        return spooled_file_response(
+            output,
+            filename=f"dataset_comparison_{'_'.join(map(str, ids))}.pdf",
+            content_type="application/pdf",
+        )
+
+
+# --------------------------------------------------
+# 🔹 HTML Dataset Report (fragment-cached)
+# --------------------------------------------------
+# Part of every fragment cache key: bump when dataset_report.html changes
+HTML_REPORT_VERSION = "1"
+
+STATISTIC_LABELS = [
+    ("count", "Count"),
+    ("mean", "Mean"),
+    ("std", "Std. Dev."),
+    ("min", "Min"),
+    ("25%", "25%"),
+    ("50%", "Median"),
+    ("75%", "75%"),
+    ("max", "Max"),
+]
+
+
+def html_report_context(dataset, user):
+    """
+    Context for reports/dataset_report.html. The expensive parts are
+    callables: the template only calls them when their {% cache %}
+    fragment misses, so a repeat view costs template assembly only.
+    """
+    def statistics():
+        # Uploads awaiting backfill_aggregates have no stored statistics
+        if dataset.summary_stats is None:
+            return []
+        stats = dataset.summary_stats["statistics"]
+        return [
+            [label] + [stats[column].get(key) for column in NUMERIC_COLUMNS]
+            for key, label in STATISTIC_LABELS
         ]
-        meta_table = Table(meta_data, colWidths=[120, 300])
-        meta_table.setStyle(TableStyle([
-            ('FONT', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONT', (1, 0), (1, -1), 'Helvetica'),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.darkslategray),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ]))
-        elements.append(meta_table)
-        elements.append(Spacer(1, 150))
-        
-        elements.append(Paragraph("CONFIDENTIAL", styles["CoverSub"]))
-        elements.append(PageBreak())
-
-        # ==========================================================
-        # 2. STATISTICAL SUMMARY
-        # ==========================================================
-        elements.append(Paragraph("1. Statistical Executive Summary", styles["Heading1"]))
-        elements.append(Spacer(1, 12))
-        elements.append(Paragraph("Descriptive statistics for key operational metrics (Flowrate, Pressure, Temperature).", styles["Normal"]))
-        elements.append(Spacer(1, 12))
-
-        # Compute Describe
-        desc = df[["flowrate", "pressure", "temperature"]].describe().round(2).reset_index()
-        # Rename columns for display
-        desc_data = [["Statistic", "Flowrate (m³/h)", "Pressure (Pa)", "Temperature (°C)"]]
-        for _, row in desc.iterrows():
-            stat_name = row['index'].capitalize()
-            if stat_name == "Count": stat_name = "Total Count"
-            desc_data.append([stat_name, row['flowrate'], row['pressure'], row['temperature']])
-
-        stat_table = Table(desc_data, colWidths=[120, 120, 120, 120])
-        stat_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            
-            ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.whitesmoke, colors.aliceblue]),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ]))
-        elements.append(stat_table)
-        elements.append(Spacer(1, 24))
-
-        # Group by Equipment Type
-        elements.append(Paragraph("Breakdown by Equipment Type", styles["Heading2"]))
-        type_counts = df["equipment_type"].value_counts().reset_index()
-        type_counts.columns = ["Type", "Count"]
-        
-        type_data = [["Equipment Type", "Count", "% Share"]]
-        total = len(df)
-        for _, row in type_counts.iterrows():
-            share = (row['Count'] / total) * 100
-            type_data.append([row['Type'], row['Count'], f"{share:.1f}%"])
-
-        type_table = Table(type_data, colWidths=[200, 100, 100], hAlign='LEFT')
-        type_table.setStyle(TableStyle([
-             ('BACKGROUND', (0, 0), (-1, 0), colors.black),
-             ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-             ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
-        ]))
-        elements.append(type_table)
-        elements.append(PageBreak())
-
-        # ==========================================================
-        # 3. ADVANCED VISUALIZATIONS
-        # ==========================================================
-        elements.append(Paragraph("2. Visual Analytics", styles["Heading1"]))
-        elements.append(Spacer(1, 12))
-
-        import matplotlib.pyplot as plt
-        import seaborn as sns
-        from io import BytesIO
-
-        # -- A. DISTRIBUTION HISTOGRAMS --
-        elements.append(Paragraph("A. Metric Distributions", styles["Heading2"]))
-        
-        fig, axes = plt.subplots(1, 3, figsize=(10, 3.5))
-        sns.histplot(df['flowrate'], ax=axes[0], color='skyblue', kde=True)
-        axes[0].set_title('Flowrate Dist.')
-        
-        sns.histplot(df['pressure'], ax=axes[1], color='salmon', kde=True)
-        axes[1].set_title('Pressure Dist.')
-        
-        sns.histplot(df['temperature'], ax=axes[2], color='lightgreen', kde=True)
-        axes[2].set_title('Temperature Dist.')
-        
-        plt.tight_layout()
-        
-        buf = BytesIO()
-        plt.savefig(buf, format='png', dpi=120)
-        plt.close(fig)
-        buf.seek(0)
-        
-        # Add Image to PDF
-        from reportlab.platypus import Image
-        img = Image(buf, width=480, height=160)
-        elements.append(img)
-        elements.append(Spacer(1, 20))
-
-        # -- B. CORRELATION HEATMAP --
-        elements.append(Paragraph("B. Correlation Matrix", styles["Heading2"]))
-        elements.append(Paragraph("Analyzes the linear relationship between variables. (1.0 = Perfect Positive, -1.0 = Perfect Negative)", styles["Normal"]))
-        elements.append(Spacer(1, 10))
-
-        plt.figure(figsize=(6, 4))
-        corr = df[["flowrate", "pressure", "temperature"]].corr()
-        sns.heatmap(corr, annot=True, cmap="coolwarm", fmt=".2f", linewidths=0.5)
-        plt.tight_layout()
-        
-        buf2 = BytesIO()
-        plt.savefig(buf2, format='png', dpi=120)
-        plt.close()
-        buf2.seek(0)
-        
-        img2 = Image(buf2, width=400, height=250)
-        elements.append(img2)
-        elements.append(PageBreak())
-
-        # ==========================================================
-        # 4. RAW DATA SAMPLE
-        # ==========================================================
-        elements.append(Paragraph("3. Raw Data Sample (First 20 Rows)", styles["Heading1"]))
-        elements.append(Spacer(1, 10))
-        
-        raw_data = [["Name", "Type", "Flow", "Pres", "Temp"]]
-        for _, row in df.head(20).iterrows():
-            raw_data.append([
-                row['equipment_type'][:15], # Truncate if long
-                row['equipment_type'],
-                f"{row['flowrate']:.1f}",
-                f"{row['pressure']:.1f}",
-                f"{row['temperature']:.1f}",
-            ])
-            
-        raw_table = Table(raw_data, colWidths=[100, 100, 80, 80, 80])
-        raw_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ]))
-        elements.append(raw_table)
-
-        # Footer Function
-        def add_footer(canvas, doc):
-            canvas.saveState()
-            canvas.setFont("Helvetica", 9)
-            canvas.drawString(40, 30, "Generated by Equipment Analytics")
-            canvas.drawRightString(A4[0]-40, 30, f"Page {doc.page} | Confidential")
-            canvas.restoreState()
-
-        doc.build(elements, onFirstPage=add_footer, onLaterPages=add_footer)
-        return response
+
+    def type_breakdown():
+        total = dataset.summary_total
+        return [
+            {"type": name, "count": count, "share": count * 100 / total}
+            for name, count in sorted(
+                dataset.summary_type_distribution.items(),
+                key=lambda item: -item[1],
+            )
+        ]
+
+    @functools.cache
+    def charts():
+        # matplotlib and the renderers load on the first chart only
+        from .charts import inline_svg
+        from .render_pool import render_report_charts
+
+        distributions, correlation = render_report_charts(
+            load_dataset_columns(dataset).numeric, fmt="svg"
+        )
+        return {
+            "distributions": inline_svg(distributions),
+            "correlation": inline_svg(correlation),
+        }
+
+    return {
+        "dataset": dataset,
+        "user": user,
+        "summary": stored_summary(dataset),
+        "statistics": statistics,
+        "statistics_ready": dataset.summary_stats is not None,
+        "type_breakdown": type_breakdown,
+        "charts": charts,
+        "report_version": HTML_REPORT_VERSION,
+        "cache_alias": settings.REPORT_HTML_CACHE_ALIAS,
+        "cache_timeout": settings.REPORT_HTML_CACHE_TIMEOUT,
+    }
+
+
+class DatasetReportHTMLView(AdmissionControlMixin, APIView):
+    permission_classes = [IsAuthenticated]
+    # A fragment cache miss renders the charts, as costly as a PDF report
+    throttle_scope = "report"
+    admission_scope = "report"
+
+    def get(self, request, dataset_id):
+        dataset = get_object_or_404(
+            Dataset,
+            id=dataset_id,
+            user=request.user,
+        )
+
+        # Predates the stored summary: nothing to show until backfill_aggregates
+        if dataset.summary_total is None:
+            return Response(
+                {"error": "The report for this dataset is not available yet."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        if not dataset.summary_total:
+            return Response(
+                {"error": "No equipment data available."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return render(
+            request,
+            "reports/dataset_report.html",
+            html_report_context(dataset, request.user),
+        )
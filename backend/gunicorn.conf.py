@@ -0,0 +1,59 @@
+"""
+Gunicorn production profile (picked up automatically from backend/).
+
+The app is preloaded in the master and warmed up (config/warmup.py), so
+pandas, matplotlib and reportlab are imported once and shared
+copy-on-write by every forked worker. Each worker then starts its own
+pre-warmed chart renderer processes (equipment/render_pool.py).
+Workers are recycled after GUNICORN_MAX_REQUESTS requests to cap memory
+growth.
+
+Every value can be overridden through the environment.
+Measure worker memory with `python benchmarks/worker_memory.py`.
+"""
+import multiprocessing
+import os
+
+cpu_count = multiprocessing.cpu_count()
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Report rendering is CPU-bound, so run one process per core (2 to 8) and
+# use a few threads per worker for the cheap I/O-bound endpoints.
+workers = int(os.environ.get("WEB_CONCURRENCY", max(2, min(cpu_count, 8))))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+worker_class = "gthread" if threads > 1 else "sync"
+
+preload_app = os.environ.get("GUNICORN_PRELOAD", "True") == "True"
+
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 500))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 50))
+
+# Large PDF reports can take a while to render
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+
+def on_starting(server):
+    # With preload_app the Django app is already loaded at this point
+    if server.cfg.preload_app:
+        from config.warmup import warm_up
+
+        warm_up()
+
+
+def post_fork(server, worker):
+    from equipment import render_pool
+
+    render_pool.start()
+
+
+def worker_exit(server, worker):
+    from equipment import render_pool
+
+    render_pool.shutdown()
@@ -1,15 +1,74 @@
 import requests
+import json
 import os
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from multipart import MultipartFileStream, UploadCancelled
+from response_cache import ResponseCache
+
+# Connections kept alive per host; matches workers.MAX_THREADS so every
+# concurrent request can reuse a pooled connection
+POOL_SIZE = 8
+
+# Seconds: (connect, read). Uploads and report downloads get a longer read timeout
+TIMEOUT = (
+    float(os.environ.get("API_CONNECT_TIMEOUT", 5)),
+    float(os.environ.get("API_READ_TIMEOUT", 30)),
+)
+TRANSFER_TIMEOUT = (TIMEOUT[0], float(os.environ.get("API_TRANSFER_TIMEOUT", 300)))
+
+OFFLINE_ERROR = "Server unreachable: showing saved data only"
+
+# Datasets per history page; the server allows up to 100
+HISTORY_PAGE_SIZE = 30
+
+
+def build_session():
+    """
+    Keep-alive session. Idempotent requests (GET/HEAD/OPTIONS) are retried
+    on connection errors and 502/503/504 with exponential backoff
+    (0.5s, 1s, 2s); POSTs are never replayed.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=POOL_SIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class APIClient:
-    BASE_URL = "http://127.0.0.1:8000/api"
+    BASE_URL = os.environ.get("API_BASE_URL", "http://127.0.0.1:8000/api").rstrip("/")
 
     def __init__(self):
         self.token = None
+        self.username = None
+        # Signed in from the cache while the server was unreachable: read-only
+        self.offline = False
+        self.session = build_session()
+        self.cache = ResponseCache()
 
     def set_token(self, token):
         self.token = token
 
+    def logout(self):
+        self.token = None
+        self.username = None
+        self.offline = False
+
     def _get_headers(self, multipart=False):
         headers = {}
         if self.token:
@@ -22,10 +81,13 @@ class APIClient:
         url = f"{self.BASE_URL}/auth/login/"
         payload = {"username": username, "password": password}
         try:
-            response = requests.post(url, json=payload)
+            response = self.session.post(url, json=payload, timeout=TIMEOUT)
             response.raise_for_status()
             data = response.json()
             self.token = data.get("token")
+            self.username = username
+            self.offline = False
+            self.cache.remember_login(username, password)
             return {"success": True, "token": self.token}
         except requests.exceptions.HTTPError as e:
             msg = "Login failed"
@@ -35,6 +97,14 @@ class APIClient:
                 except:
                     pass
             return {"success": False, "error": msg}
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            # Offline: open this user's cached data if they signed in here before
+            if self.cache.check_login(username, password):
+                self.token = None
+                self.username = username
+                self.offline = True
+                return {"success": True, "token": "", "offline": True}
+            return {"success": False, "error": str(e)}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -42,7 +112,7 @@ class APIClient:
         url = f"{self.BASE_URL}/auth/register/"
         payload = {"username": username, "email": email, "password": password}
         try:
-            response = requests.post(url, json=payload)
+            response = self.session.post(url, json=payload, timeout=TIMEOUT)
             response.raise_for_status()
             return {"success": True}
         except requests.exceptions.HTTPError as e:
@@ -58,44 +128,84 @@ class APIClient:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def get_history(self):
-        url = f"{self.BASE_URL}/history/"
+    def _cached_get(self, url):
+        """
+        GET through the on-disk cache. A stored copy is revalidated with
+        If-None-Match (304 reuses it) and served, marked "offline", when
+        the server cannot be reached.
+        """
+        key = f"{self.username} {url}"
+        cached = self.cache.get(key)
+
+        def from_cache():
+            if cached is None:
+                return None
+            return {"success": True, "data": json.loads(cached[1]), "offline": True}
+
+        if self.offline:
+            return from_cache() or {"success": False, "error": "Not available offline"}
+
+        headers = self._get_headers()
+        if cached is not None and cached[0]:
+            headers["If-None-Match"] = cached[0]
         try:
-            response = requests.get(url, headers=self._get_headers())
-            response.raise_for_status()
-            return {"success": True, "data": response.json()}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+            response = self.session.get(url, headers=headers, timeout=TIMEOUT)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            return from_cache() or {"success": False, "error": str(e)}
 
-    def get_dataset_summary(self, dataset_id):
-        url = f"{self.BASE_URL}/summary/{dataset_id}/"
+        if response.status_code == 304 and cached is not None:
+            return {"success": True, "data": json.loads(cached[1])}
+        if response.status_code in (502, 503, 504) and cached is not None:
+            return from_cache()
         try:
-            response = requests.get(url, headers=self._get_headers())
             response.raise_for_status()
-            return {"success": True, "data": response.json()}
+            data = response.json()
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def get_scatter_data(self, dataset_id):
+        self.cache.put(key, response.headers.get("ETag"), response.content)
+        return {"success": True, "data": data}
+
+    def get_history(self):
+        return self._cached_get(f"{self.BASE_URL}/history/")
+
+    def get_history_page(self, page, page_size=HISTORY_PAGE_SIZE):
+        """
+        {"count", "next", "previous", "results"} for one page of datasets.
+        """
+        return self._cached_get(f"{self.BASE_URL}/history/?page={page}&page_size={page_size}")
+
+    def get_dataset_summary(self, dataset_id):
+        return self._cached_get(f"{self.BASE_URL}/summary/{dataset_id}/")
+
+    def get_scatter_data(self, dataset_id, max_points=None):
+        # max_points: server-side uniform sample (total_points keeps the full count)
         url = f"{self.BASE_URL}/datasets/{dataset_id}/scatter/"
-        try:
-            response = requests.get(url, headers=self._get_headers())
-            response.raise_for_status()
-            return {"success": True, "data": response.json()}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        if max_points is not None:
+            url += f"?max_points={max_points}"
+        return self._cached_get(url)
 
-    def upload_dataset(self, file_path):
+    def upload_dataset(self, file_path, progress=None, cancel_event=None):
+        """
+        Stream the CSV as multipart/form-data in fixed-size chunks.
+        progress(sent, total) reports file bytes sent; setting cancel_event
+        aborts the upload.
+        """
+        if self.offline:
+            return {"success": False, "error": OFFLINE_ERROR}
         url = f"{self.BASE_URL}/upload/"
         try:
-            filename = os.path.basename(file_path)
-            # requests handles multipart boundaries automatically when 'files' is passed
-            with open(file_path, 'rb') as f:
-                files = {'file': (filename, f, 'text/csv')}
-                # Do NOT set Content-Type header manually for multipart/form-data
-                response = requests.post(url, headers=self._get_headers(multipart=True), files=files)
-                response.raise_for_status()
-                return {"success": True, "data": response.json()}
+            body = MultipartFileStream(
+                "file", file_path, "text/csv",
+                progress=progress, cancel_event=cancel_event,
+            )
+            headers = self._get_headers(multipart=True)
+            headers["Content-Type"] = body.content_type
+            response = self.session.post(url, headers=headers, data=body, timeout=TRANSFER_TIMEOUT)
+            response.raise_for_status()
+            return {"success": True, "data": response.json()}
+        except UploadCancelled as e:
+            return {"success": False, "error": str(e), "cancelled": True}
         except requests.exceptions.HTTPError as e:
             msg = "Upload failed"
             if e.response is not None:
@@ -107,17 +217,89 @@ class APIClient:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def download_report(self, dataset_id, save_path):
+    def download_report(self, dataset_id, save_path, timeout=300):
+        """
+        Download the PDF report, resuming an interrupted download.
+        Partial data is kept in `<save_path>.part` (and its ETag in `.part.etag`)
+        until the transfer completes.
+        """
+        if self.offline:
+            return {"success": False, "error": OFFLINE_ERROR}
         url = f"{self.BASE_URL}/report/{dataset_id}/"
+        part_path = save_path + ".part"
+        etag_path = part_path + ".etag"
         try:
-            response = requests.get(url, headers=self._get_headers(), stream=True)
+            headers = self._get_headers()
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+                if os.path.exists(etag_path):
+                    with open(etag_path) as f:
+                        # Server sends the whole file if the report changed since
+                        headers["If-Range"] = f.read().strip()
+
+            # The server renders reports in the background: 202 means "not ready yet"
+            deadline = time.monotonic() + timeout
+            while True:
+                response = self.session.get(url, headers=headers, stream=True, timeout=TRANSFER_TIMEOUT)
+                if response.status_code == 416:
+                    # Stale partial file: start over
+                    response.close()
+                    headers.pop("Range", None)
+                    headers.pop("If-Range", None)
+                    continue
+                if response.status_code != 202:
+                    break
+                response.close()
+                # The report URL is rate limited: wait on the status URL, then download once
+                error = self._wait_for_report(
+                    response.headers["Location"], deadline,
+                    float(response.headers.get("Retry-After", 2)),
+                )
+                if error:
+                    return {"success": False, "error": error}
+
+            if response.status_code == 500:
+                try:
+                    # A failed render: the status payload carries its error
+                    return {"success": False, "error": response.json()["error"]}
+                except (ValueError, KeyError):
+                    pass
             response.raise_for_status()
-            with open(save_path, 'wb') as f:
+
+            mode = 'ab' if response.status_code == 206 else 'wb'
+            if response.headers.get("ETag"):
+                with open(etag_path, 'w') as f:
+                    f.write(response.headers["ETag"])
+
+            with open(part_path, mode) as f:
                 for chunk in response.iter_content(chunk_size=8192):
                     f.write(chunk)
+
+            os.replace(part_path, save_path)
+            if os.path.exists(etag_path):
+                os.remove(etag_path)
             return {"success": True}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _wait_for_report(self, status_url, deadline, delay):
+        """
+        Poll the report status until it is ready. Returns None when ready,
+        otherwise the error to show.
+        """
+        while True:
+            if time.monotonic() > deadline:
+                return "Report generation timed out"
+            time.sleep(delay)
+            response = self.session.get(status_url, headers=self._get_headers(), timeout=TIMEOUT)
+            response.raise_for_status()
+            job = response.json()
+            if job["status"] == "ready":
+                return None
+            if job["status"] == "failed":
+                return job.get("error") or "Report generation failed"
+            delay = float(response.headers.get("Retry-After", delay))
+
 # Global instance
 api_client = APIClient()
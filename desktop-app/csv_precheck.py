@@ -0,0 +1,152 @@
+"""
+Local scan of a CSV before it is uploaded.
+
+Applies the server's upload rules (CSVUploadView and
+equipment/validators.py) to the file on disk: readable, exact headers,
+at least one and at most MAX_ROWS data rows, per-row field checks and
+(name, type) de-duplication. It also computes the summary the dashboard
+will show. Fatal problems (the server would reject the whole file) come
+back as "error"; invalid or duplicate rows are counted, and the first
+few are listed, because the server skips those rows and stores the rest.
+
+Only csv and NumPy: the desktop app does not ship pandas.
+"""
+import csv
+
+import numpy as np
+
+EXPECTED_COLUMNS = ["Equipment Name", "Type", "Flowrate", "Pressure", "Temperature"]
+# Same limit as CSVUploadView.MAX_ROWS
+MAX_ROWS = 25_000
+MAX_LISTED_ERRORS = 20
+
+# Column -> exclusive lower bound, as in validate_equipment_row
+NUMERIC_RULES = {"Flowrate": 0, "Pressure": -1, "Temperature": None}
+
+
+def parse_numbers(values):
+    """
+    float array of a text column plus (blank, not-a-number) masks.
+    """
+    text = np.char.strip(np.array(values, dtype=str))
+    blank = text == ""
+    try:
+        numbers = np.where(blank, "nan", text).astype(float)
+        bad = np.zeros(len(text), dtype=bool)
+    except ValueError:
+        # Slow path only for columns that contain non-numeric cells
+        numbers = np.full(len(text), np.nan)
+        bad = np.zeros(len(text), dtype=bool)
+        for i, value in enumerate(text):
+            try:
+                numbers[i] = float(value)
+            except ValueError:
+                bad[i] = not blank[i]
+    return numbers, blank, bad
+
+
+def read_columns(path):
+    """
+    (header, columns) with at most MAX_ROWS + 1 data rows; blank lines
+    are skipped like pandas does.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        rows = []
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            if len(row) > len(EXPECTED_COLUMNS):
+                raise ValueError(f"row {len(rows) + 1} has {len(row)} fields")
+            rows.append(row + [""] * (len(EXPECTED_COLUMNS) - len(row)))
+            if len(rows) > MAX_ROWS:
+                break
+    columns = list(zip(*rows)) if rows else [()] * len(EXPECTED_COLUMNS)
+    return header, columns
+
+
+def precheck_csv(path):
+    try:
+        header, columns = read_columns(path)
+    except (OSError, UnicodeDecodeError, csv.Error, ValueError):
+        return {"ok": False, "error": "Unable to read CSV file."}
+
+    if header is None:
+        return {"ok": False, "error": "Unable to read CSV file."}
+    if header != EXPECTED_COLUMNS:
+        return {
+            "ok": False,
+            "error": "CSV column headers are invalid.",
+            "expected_columns": EXPECTED_COLUMNS,
+            "received_columns": header,
+        }
+
+    total = len(columns[0])
+    if not total:
+        return {"ok": False, "error": "CSV file contains no data rows."}
+    if total > MAX_ROWS:
+        return {"ok": False, "error": f"CSV file exceeds maximum allowed rows ({MAX_ROWS:,})."}
+
+    names = np.char.strip(np.array(columns[0], dtype=str))
+    types = np.char.strip(np.array(columns[1], dtype=str))
+
+    # field -> (mask of failing rows, message), in validator order
+    checks = {
+        "equipment_name": [(names == "", "Equipment Name is required")],
+        "equipment_type": [(types == "", "Type is required")],
+    }
+    numbers = {}
+    for offset, (column, lower) in enumerate(NUMERIC_RULES.items()):
+        values, blank, bad = parse_numbers(columns[2 + offset])
+        numbers[column] = values
+        # The model fields are NOT NULL, so blank cells can't be stored
+        rules = [(blank, f"{column} is required"), (bad, f"{column} must be a number")]
+        if lower is not None:
+            rules.append((values <= lower, f"{column} must be greater than {lower}"))
+        checks[column.lower()] = rules
+
+    invalid = np.zeros(total, dtype=bool)
+    for rules in checks.values():
+        for mask, _ in rules:
+            invalid |= mask
+
+    errors = []
+    for index in np.flatnonzero(invalid)[:MAX_LISTED_ERRORS]:
+        row_errors = {}
+        for field, rules in checks.items():
+            for mask, message in rules:
+                if mask[index]:
+                    row_errors[field] = message
+                    break
+        errors.append({"row": int(index) + 1, "errors": row_errors})
+
+    # Server keeps the first row of each case-insensitive (name, type)
+    valid = np.flatnonzero(~invalid)
+    keys = np.char.add(np.char.add(np.char.lower(names[valid]), "\x00"), np.char.lower(types[valid]))
+    _, first = np.unique(keys, return_index=True)
+    kept = valid[np.sort(first)]
+
+    type_names, type_counts = np.unique(types[kept], return_counts=True)
+    order = np.argsort(-type_counts, kind="stable")
+
+    def average(column):
+        return float(numbers[column][kept].mean()) if len(kept) else None
+
+    return {
+        "ok": True,
+        "total_rows": total,
+        "inserted": len(kept),
+        "failed": int(invalid.sum()),
+        "duplicates": len(valid) - len(kept),
+        "errors": errors,
+        "summary": {
+            "total_equipment": len(kept),
+            "average_flowrate": average("Flowrate"),
+            "average_pressure": average("Pressure"),
+            "average_temperature": average("Temperature"),
+            "equipment_type_distribution": {
+                str(type_names[i]): int(type_counts[i]) for i in order
+            },
+        },
+    }
@@ -63,7 +63,10 @@ class MainWindow(QMainWindow):
 
     def on_logout(self):
         from api_client import api_client
-        api_client.set_token(None)
+        from prefetch import prefetcher
+        api_client.logout()
+        # Cached details belong to the account that fetched them
+        prefetcher.clear()
         self.stacked_widget.setCurrentIndex(0)  # Go to Login
 
     def on_upload_success(self):
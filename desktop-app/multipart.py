@@ -0,0 +1,68 @@
+"""
+Streaming multipart/form-data body for file uploads.
+
+requests builds `files=` bodies entirely in memory. MultipartFileStream
+instead yields the part headers, the file in CHUNK_SIZE reads and the
+closing boundary, so memory stays constant whatever the file size. Its
+length is known up front, so the request carries a Content-Length (no
+chunked encoding).
+
+    body = MultipartFileStream("file", path, "text/csv", progress=on_progress)
+    session.post(url, data=body, headers={"Content-Type": body.content_type})
+"""
+import os
+import threading
+import uuid
+
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadCancelled(Exception):
+    pass
+
+
+class MultipartFileStream:
+    """
+    A single file field. progress(sent, total) is called as file data is
+    read (at most about once per percent). Setting cancel_event aborts the
+    upload with UploadCancelled at the next chunk.
+    """
+
+    def __init__(self, field, path, content_type, progress=None, cancel_event=None,
+                 chunk_size=CHUNK_SIZE):
+        self.path = path
+        self.progress = progress
+        self.cancel_event = cancel_event or threading.Event()
+        self.chunk_size = chunk_size
+
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        filename = os.path.basename(path).replace('"', "%22")
+        self.head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self.tail = f"\r\n--{boundary}--\r\n".encode()
+        self.file_size = os.path.getsize(path)
+
+    def __len__(self):
+        return len(self.head) + self.file_size + len(self.tail)
+
+    def __iter__(self):
+        yield self.head
+
+        sent = reported = 0
+        step = max(self.file_size // 100, 1)
+        with open(self.path, "rb") as f:
+            while chunk := f.read(self.chunk_size):
+                if self.cancel_event.is_set():
+                    raise UploadCancelled("Upload cancelled")
+                yield chunk
+                sent += len(chunk)
+                if self.progress is not None and (sent - reported >= step or sent == self.file_size):
+                    reported = sent
+                    self.progress(sent, self.file_size)
+
+        yield self.tail
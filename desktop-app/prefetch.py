@@ -0,0 +1,131 @@
+"""
+Background prefetch of dataset details.
+
+When the dashboard shows its cards, the datasets in view get their
+summary and a downsampled scatter fetched at low priority into
+detail_cache, a bounded in-memory LRU. SummaryWindow reads from the
+cache first, so opening a prefetched dataset renders immediately and
+only the full-resolution scatter is fetched afterwards.
+"""
+from collections import OrderedDict
+
+from api_client import api_client
+from workers import TaskGroup
+
+MAX_ENTRIES = 32
+# Scatter points held across all cached scatters
+MAX_POINTS = 200_000
+PREFETCH_SCATTER_POINTS = 2000
+# Below the default 0, so queued user requests run first
+PREFETCH_PRIORITY = -1
+# Keep most pool threads free for requests the user is waiting on
+MAX_IN_FLIGHT = 2
+
+
+def is_sampled(scatter_result):
+    data = scatter_result["data"]
+    return data.get("total_points", 0) > len(data["points"])
+
+
+class DetailCache:
+    """
+    API results keyed by ("summary" | "scatter", dataset_id), evicted
+    least-recently-used beyond MAX_ENTRIES entries or MAX_POINTS points.
+    Only touched from the GUI thread.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_points=MAX_POINTS):
+        self.max_entries = max_entries
+        self.max_points = max_points
+        self.entries = OrderedDict()
+        self.points = 0
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    @staticmethod
+    def _points(result):
+        return len(result["data"].get("points", ()))
+
+    def get(self, kind, dataset_id):
+        key = (kind, dataset_id)
+        result = self.entries.get(key)
+        if result is not None:
+            self.entries.move_to_end(key)
+        return result
+
+    def put(self, kind, dataset_id, result):
+        points = self._points(result)
+        if points > self.max_points:
+            return
+        key = (kind, dataset_id)
+        if key in self.entries:
+            self.points -= self._points(self.entries.pop(key))
+        self.entries[key] = result
+        self.points += points
+
+        while len(self.entries) > self.max_entries or self.points > self.max_points:
+            _, evicted = self.entries.popitem(last=False)
+            self.points -= self._points(evicted)
+
+    def clear(self):
+        self.entries.clear()
+        self.points = 0
+
+
+class Prefetcher:
+    def __init__(self, cache):
+        self.cache = cache
+        self.tasks = TaskGroup()
+        self.queue = []
+        self.pending = set()
+
+    def prefetch(self, dataset_ids):
+        """
+        Fetch details of dataset_ids (most wanted first) that are not
+        cached yet. Replaces whatever was still queued.
+        """
+        self.queue = [
+            (kind, dataset_id)
+            for dataset_id in dataset_ids
+            for kind in ("summary", "scatter")
+            if (kind, dataset_id) not in self.cache
+        ]
+        self._start_next()
+
+    def _start_next(self):
+        while self.queue and len(self.pending) < MAX_IN_FLIGHT:
+            key = self.queue.pop(0)
+            if key in self.pending or key in self.cache:
+                continue
+            kind, dataset_id = key
+            self.pending.add(key)
+            on_result = lambda result, key=key: self._on_result(key, result)
+            if kind == "summary":
+                self.tasks.run(
+                    api_client.get_dataset_summary, dataset_id,
+                    on_result=on_result, priority=PREFETCH_PRIORITY,
+                )
+            else:
+                self.tasks.run(
+                    api_client.get_scatter_data, dataset_id,
+                    max_points=PREFETCH_SCATTER_POINTS,
+                    on_result=on_result, priority=PREFETCH_PRIORITY,
+                )
+
+    def _on_result(self, key, result):
+        self.pending.discard(key)
+        # Never replace what SummaryWindow stored meanwhile (e.g. a full scatter)
+        if result["success"] and key not in self.cache:
+            self.cache.put(*key, result)
+        self._start_next()
+
+    def clear(self):
+        self.tasks.cancel()
+        self.queue = []
+        self.pending.clear()
+        self.cache.clear()
+
+
+detail_cache = DetailCache()
+prefetcher = Prefetcher(detail_cache)
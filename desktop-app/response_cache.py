@@ -0,0 +1,135 @@
+"""
+On-disk cache of API responses for the desktop client.
+
+A single SQLite file under the user's cache directory keeps GET response
+bodies with their ETags, so APIClient can revalidate with If-None-Match
+(304: reuse the stored body) and fall back to the stored copy when the
+server is unreachable. Entries are evicted least-recently-used once the
+file holds more than max_bytes of bodies.
+
+It also keeps a salted PBKDF2 hash of each user's password from the last
+successful login, which lets a returning user open the cache read-only
+while offline.
+"""
+import hashlib
+import os
+import secrets
+import sqlite3
+import sys
+import threading
+import time
+
+APP_DIR_NAME = "fossee-data-visualizer"
+MAX_BYTES = int(os.environ.get("API_CACHE_MAX_BYTES", 50 * 2**20))
+PBKDF2_ITERATIONS = 200_000
+
+
+def default_cache_dir():
+    if os.environ.get("API_CACHE_DIR"):
+        return os.environ["API_CACHE_DIR"]
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, APP_DIR_NAME)
+
+
+def hash_password(password, salt):
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, PBKDF2_ITERATIONS)
+
+
+class ResponseCache:
+    """
+    Shared by the worker threads: one connection, guarded by a lock.
+    """
+
+    def __init__(self, path=None, max_bytes=MAX_BYTES):
+        if path is None:
+            cache_dir = default_cache_dir()
+            os.makedirs(cache_dir, exist_ok=True)
+            path = os.path.join(cache_dir, "responses.sqlite3")
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                etag TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS credentials (
+                username TEXT PRIMARY KEY,
+                salt BLOB NOT NULL,
+                hash BLOB NOT NULL
+            )
+        """)
+
+    def get(self, key):
+        """
+        (etag, body) of the stored response, or None. Marks it recently used.
+        """
+        with self.lock:
+            row = self.db.execute(
+                "SELECT etag, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self.db.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        return row
+
+    def put(self, key, etag, body):
+        if len(body) > self.max_bytes:
+            return
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, body, size, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, etag, body, len(body), time.time()),
+            )
+            self._evict()
+
+    def _evict(self):
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Oldest first until the bodies fit again
+        stale = []
+        for key, size in self.db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self.db.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def remember_login(self, username, password):
+        salt = secrets.token_bytes(16)
+        digest = hash_password(password, salt)
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO credentials (username, salt, hash) VALUES (?, ?, ?)",
+                (username, salt, digest),
+            )
+
+    def check_login(self, username, password):
+        with self.lock:
+            row = self.db.execute(
+                "SELECT salt, hash FROM credentials WHERE username = ?", (username,)
+            ).fetchone()
+        if row is None:
+            return False
+        salt, digest = row
+        return secrets.compare_digest(hash_password(password, salt), digest)
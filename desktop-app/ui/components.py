@@ -2,7 +2,7 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QGraphicsDropShadowEffect, 
     QHBoxLayout, QFrame
 )
-from PyQt5.QtCore import Qt, QPropertyAnimation, QPoint, QTimer, pyqtSignal, QRect
+from PyQt5.QtCore import Qt, QEvent, QPropertyAnimation, QPoint, QTimer, QRect
 
 class ToastNotification(QWidget):
     def __init__(self, parent):
@@ -68,77 +68,18 @@ class ToastNotification(QWidget):
 
 from datetime import datetime
 
-class ClickableCard(QFrame):
-    clicked = pyqtSignal(int) # Emits dataset ID
-
-    def __init__(self, dataset_id, title, date_str, equipment_count):
-        super().__init__()
-        self.dataset_id = dataset_id
-        self.setCursor(Qt.PointingHandCursor)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: rgba(255, 255, 255, 0.08);
-                border-radius: 15px;
-            }
-        """)
-        self.setFixedSize(280, 180)
-        
-        layout = QVBoxLayout()
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        title_lbl = QLabel(title)
-        title_lbl.setWordWrap(True)
-        title_lbl.setStyleSheet("font-size: 18px; font-weight: bold; color: white; background: transparent;")
-        
-        # Format Date
-        formatted_date = date_str
-        try:
-            # Assuming format like "2023-10-25 14:30:00" or similar
-            # If input is ISO with T "2023-10-25T14:30:00.123Z", we handle it
-            clean_date = date_str.replace("T", " ").split(".")[0]
-            dt_obj = datetime.strptime(clean_date, "%Y-%m-%d %H:%M:%S")
-            formatted_date = dt_obj.strftime("%b %d, %Y • %H:%M")
-        except:
-            pass
-
-        date_lbl = QLabel(f"Uploaded: {formatted_date}")
-        date_lbl.setStyleSheet("font-size: 12px; color: rgba(255,255,255,0.6); background: transparent;")
-        
-        count_lbl = QLabel(f"{equipment_count} Equipments")
-        count_lbl.setStyleSheet("font-size: 14px; color: #4fd1c5; font-weight: bold; margin-top: 10px; background: transparent;")
-        
-        layout.addWidget(title_lbl)
-        layout.addWidget(date_lbl)
-        layout.addStretch()
-        layout.addWidget(count_lbl)
-        self.setLayout(layout)
-
-        # Hover Animation
-        self.default_y = 0
-
-    def enterEvent(self, event):
-        self.setStyleSheet("""
-            QFrame {
-                background-color: rgba(255, 255, 255, 0.12);
-                border-radius: 15px;
-                border: 1px solid rgba(255,255,255,0.1);
-            }
-        """)
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        self.setStyleSheet("""
-            QFrame {
-                background-color: rgba(255, 255, 255, 0.08);
-                border-radius: 15px;
-                border: none;
-            }
-        """)
-        super().leaveEvent(event)
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit(self.dataset_id)
+def format_upload_date(date_str):
+    # Format Date
+    formatted_date = date_str
+    try:
+        # Assuming format like "2023-10-25 14:30:00" or similar
+        # If input is ISO with T "2023-10-25T14:30:00.123Z", we handle it
+        clean_date = date_str.replace("T", " ").split(".")[0]
+        dt_obj = datetime.strptime(clean_date, "%Y-%m-%d %H:%M:%S")
+        formatted_date = dt_obj.strftime("%b %d, %Y • %H:%M")
+    except:
+        pass
+    return formatted_date
 
 
 class StatBox(QFrame):
@@ -157,10 +98,56 @@ class StatBox(QFrame):
         lbl.setAlignment(Qt.AlignCenter)
         lbl.setStyleSheet("color: rgba(255,255,255,0.7); font-size: 12px; background: transparent;")
         
-        val = QLabel(str(value))
-        val.setAlignment(Qt.AlignCenter)
-        val.setStyleSheet("color: white; font-size: 22px; font-weight: bold; background: transparent;")
+        self.value_lbl = QLabel(str(value))
+        self.value_lbl.setAlignment(Qt.AlignCenter)
+        self.value_lbl.setStyleSheet("color: white; font-size: 22px; font-weight: bold; background: transparent;")
         
         layout.addWidget(lbl)
-        layout.addWidget(val)
+        layout.addWidget(self.value_lbl)
+        self.setLayout(layout)
+
+    def set_value(self, value):
+        self.value_lbl.setText(str(value))
+
+
+class LoadingOverlay(QWidget):
+    """
+    Translucent "Loading..." layer over a parent widget while its data loads.
+    """
+
+    def __init__(self, parent, text="Loading..."):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_StyledBackground)
+        self.setStyleSheet("background-color: rgba(15, 32, 39, 0.6);")
+
+        layout = QVBoxLayout()
+        layout.setAlignment(Qt.AlignCenter)
+        self.label = QLabel(text)
+        self.label.setStyleSheet("""
+            background-color: rgba(255, 255, 255, 0.1);
+            color: #4fd1c5;
+            padding: 12px 24px;
+            border-radius: 8px;
+            font-weight: bold;
+            font-size: 14px;
+        """)
+        layout.addWidget(self.label)
         self.setLayout(layout)
+
+        parent.installEventFilter(self)
+        self.hide()
+
+    def eventFilter(self, obj, event):
+        if obj is self.parent() and event.type() == QEvent.Resize:
+            self.setGeometry(obj.rect())
+        return super().eventFilter(obj, event)
+
+    def start(self, text=None):
+        if text:
+            self.label.setText(text)
+        self.setGeometry(self.parent().rect())
+        self.show()
+        self.raise_()
+
+    def stop(self):
+        self.hide()
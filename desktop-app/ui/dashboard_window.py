@@ -1,11 +1,14 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QScrollArea, QMessageBox, QFrame
+    QListView, QMessageBox, QFrame
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from api_client import api_client
-from ui.components import ClickableCard, ToastNotification
-from ui.flow_layout import FlowLayout
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from prefetch import prefetcher
+from ui.components import LoadingOverlay, ToastNotification
+from ui.dataset_list import DatasetCardDelegate, DatasetListModel, DatasetRole
+
+# Datasets whose details are prefetched: the visible cards, capped
+PREFETCH_CARDS = 12
 
 class DashboardWindow(QWidget):
     logoutSignal = pyqtSignal()
@@ -14,6 +17,15 @@ class DashboardWindow(QWidget):
 
     def __init__(self):
         super().__init__()
+        self.stale = False
+        self.model = DatasetListModel(self)
+        self.model.pageLoaded.connect(self.on_page_loaded)
+
+        # Prefetch once scrolling settles, not for every pixel
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(300)
+        self.prefetch_timer.timeout.connect(self.prefetch_visible)
         self.initUI()
 
     def initUI(self):
@@ -89,55 +101,88 @@ class DashboardWindow(QWidget):
         action_layout.addWidget(upload_btn)
         main_layout.addLayout(action_layout)
 
-        # Scroll Area for Cards
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-        
-        self.cards_container = QWidget()
-        self.cards_container.setStyleSheet("background: transparent;")
-        self.flow_layout = FlowLayout(self.cards_container, margin=0, spacing=20)
-        
-        scroll.setWidget(self.cards_container)
-        main_layout.addWidget(scroll)
+        # Cards: a list view over the paged model. Only visible cards are
+        # painted; scrolling near the end fetches the next page
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(DatasetCardDelegate(self.list_view))
+        self.list_view.setViewMode(QListView.IconMode)
+        self.list_view.setFlow(QListView.LeftToRight)
+        self.list_view.setWrapping(True)
+        self.list_view.setResizeMode(QListView.Adjust)
+        self.list_view.setMovement(QListView.Static)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSpacing(10)
+        self.list_view.setSelectionMode(QListView.NoSelection)
+        self.list_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.list_view.setMouseTracking(True)
+        self.list_view.viewport().setCursor(Qt.PointingHandCursor)
+        self.list_view.setStyleSheet("QListView { border: none; background: transparent; }")
+        self.list_view.clicked.connect(self.on_card_click)
+        self.list_view.verticalScrollBar().valueChanged.connect(self.prefetch_timer.start)
+        main_layout.addWidget(self.list_view)
+
+        self.empty_label = QLabel("No datasets found.")
+        self.empty_label.setStyleSheet("color: rgba(255,255,255,0.5); font-size: 16px;")
+        self.empty_label.hide()
+        main_layout.addWidget(self.empty_label)
+
+        # Covers the cards only, header buttons stay usable
+        self.loading = LoadingOverlay(self.list_view, "Loading datasets...")
 
         self.setLayout(main_layout)
 
     def load_data(self):
-        # Clear existing cards
-        while self.flow_layout.count():
-            item = self.flow_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        result = api_client.get_history()
-        
+        # A newer refresh supersedes the one in flight
+        self.stale = False
+        self.empty_label.hide()
+        self.loading.start()
+        self.model.reload()
+
+    def on_page_loaded(self, page, result):
+        if page != 1:
+            if not result["success"]:
+                self.toast.show_message(f"Failed to load more: {result['error']}", is_error=True)
+            return
+
+        self.loading.stop()
         if result["success"]:
-            datasets = result["data"]
-            if not datasets:
-                lbl = QLabel("No datasets found.")
-                lbl.setStyleSheet("color: rgba(255,255,255,0.5); font-size: 16px;")
-                self.flow_layout.addWidget(lbl)
-                return
-
-            for ds in datasets:
-                uploaded = ds["uploaded_at"].replace("T", " ").split(".")[0]
-                summary = ds.get("summary", {})
-                count = summary.get("total_equipment", 0)
-                
-                card = ClickableCard(
-                    ds["dataset_id"],
-                    ds["dataset_name"],
-                    uploaded,
-                    count
-                )
-                card.clicked.connect(self.on_card_click)
-                self.flow_layout.addWidget(card)
+            if result.get("offline"):
+                self.toast.show_message("Offline: showing saved datasets", is_error=True)
+            self.empty_label.setVisible(self.model.rowCount() == 0)
+            self.prefetch_timer.start()
         else:
             self.toast.show_message(f"Failed to load: {result['error']}", is_error=True)
 
-    def on_card_click(self, dataset_id):
-        self.viewDetailsSignal.emit(dataset_id)
+    def prefetch_visible(self):
+        """
+        Warm the detail cache for the cards in view, top-left first. Before
+        the view is laid out, the most recent datasets stand in for them.
+        """
+        viewport = self.list_view.viewport().rect()
+        indexes = [self.model.index(row) for row in range(self.model.rowCount())]
+        visible = [i for i in indexes if self.list_view.visualRect(i).intersects(viewport)]
+        prefetcher.prefetch([
+            index.data(DatasetRole)["dataset_id"]
+            for index in (visible or indexes)[:PREFETCH_CARDS]
+        ])
+
+    def on_card_click(self, index):
+        self.viewDetailsSignal.emit(index.data(DatasetRole)["dataset_id"])
+
+    # Navigating away drops an unfinished refresh; redo it on return
+    def hideEvent(self, event):
+        if self.model.loading:
+            self.model.cancel()
+            self.loading.stop()
+            # Only the first page needs a full reload; later pages refetch on scroll
+            self.stale = self.model.rowCount() == 0
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.stale:
+            self.load_data()
 
     # Ensure toast resizes with window
     def resizeEvent(self, event):
@@ -0,0 +1,160 @@
+"""
+Paged, virtualized dataset list for the dashboard.
+
+DatasetListModel holds plain dicts from the paginated history API and
+fetches the next page when the view scrolls near the end (Qt's
+canFetchMore/fetchMore, answered asynchronously on the worker pool).
+DatasetCardDelegate paints each dataset as a card, so only the visible
+rows are ever drawn and no widget exists per dataset.
+"""
+from PyQt5.QtCore import (
+    QAbstractListModel, QModelIndex, QRectF, QSize, Qt, pyqtSignal
+)
+from PyQt5.QtGui import QColor, QFont, QPainter, QPainterPath, QPen
+from PyQt5.QtWidgets import QStyle, QStyledItemDelegate
+
+from api_client import api_client
+from ui.components import format_upload_date
+from workers import TaskGroup
+
+CARD_SIZE = QSize(280, 180)
+CARD_PADDING = 20
+
+DatasetRole = Qt.UserRole + 1
+
+
+class DatasetListModel(QAbstractListModel):
+    # (page, result) after each page request, including failures
+    pageLoaded = pyqtSignal(int, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tasks = TaskGroup()
+        self.datasets = []
+        self.ids = set()
+        self.next_page = None
+        self.loading = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.datasets)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        dataset = self.datasets[index.row()]
+        if role == DatasetRole:
+            return dataset
+        if role == Qt.DisplayRole:
+            return dataset["dataset_name"]
+        return None
+
+    def reload(self):
+        """
+        Drop every loaded page and fetch the first one again.
+        """
+        self.tasks.cancel()
+        self.beginResetModel()
+        self.datasets = []
+        self.ids = set()
+        self.endResetModel()
+        self.next_page = 1
+        self.loading = False
+        self.fetchMore(QModelIndex())
+
+    def cancel(self):
+        self.tasks.cancel()
+        self.loading = False
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.next_page is not None and not self.loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self.loading = True
+        page = self.next_page
+        self.tasks.run(
+            api_client.get_history_page, page,
+            on_result=lambda result: self.on_page_loaded(page, result),
+        )
+
+    def on_page_loaded(self, page, result):
+        self.loading = False
+        if not result["success"]:
+            # next_page is kept: scrolling again retries it
+            self.pageLoaded.emit(page, result)
+            return
+
+        data = result["data"]
+        # Uploads since the first page shift later pages: skip repeats
+        new = [d for d in data["results"] if d["dataset_id"] not in self.ids]
+        self.next_page = page + 1 if data["next"] else None
+
+        if new:
+            first = len(self.datasets)
+            self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+            self.datasets.extend(new)
+            self.ids.update(d["dataset_id"] for d in new)
+            self.endInsertRows()
+
+        self.pageLoaded.emit(page, result)
+
+
+class DatasetCardDelegate(QStyledItemDelegate):
+    """
+    Paints a dataset card: name, upload date, equipment count.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont()
+        self.title_font.setPixelSize(18)
+        self.title_font.setBold(True)
+        self.date_font = QFont()
+        self.date_font.setPixelSize(12)
+        self.count_font = QFont()
+        self.count_font.setPixelSize(14)
+        self.count_font.setBold(True)
+
+    def sizeHint(self, option, index):
+        return CARD_SIZE
+
+    def paint(self, painter, option, index):
+        dataset = index.data(DatasetRole)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5)
+        path = QPainterPath()
+        path.addRoundedRect(rect, 15, 15)
+        painter.fillPath(path, QColor(255, 255, 255, 31 if hovered else 20))
+        if hovered:
+            painter.setPen(QPen(QColor(255, 255, 255, 26), 1))
+            painter.drawPath(path)
+
+        content = option.rect.adjusted(CARD_PADDING, CARD_PADDING, -CARD_PADDING, -CARD_PADDING)
+
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("white"))
+        title_rect = painter.boundingRect(
+            content, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, dataset["dataset_name"]
+        )
+        title_rect.setHeight(min(title_rect.height(), content.height() // 2))
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, dataset["dataset_name"])
+
+        painter.setFont(self.date_font)
+        painter.setPen(QColor(255, 255, 255, 153))
+        date_rect = content.adjusted(0, title_rect.height() + 6, 0, 0)
+        painter.drawText(
+            date_rect, Qt.AlignLeft | Qt.AlignTop,
+            f"Uploaded: {format_upload_date(dataset['uploaded_at'])}",
+        )
+
+        count = (dataset.get("summary") or {}).get("total_equipment", 0)
+        painter.setFont(self.count_font)
+        painter.setPen(QColor("#4fd1c5"))
+        painter.drawText(content, Qt.AlignLeft | Qt.AlignBottom, f"{count} Equipments")
+
+        painter.restore()
@@ -3,6 +3,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 from api_client import api_client
+from workers import TaskGroup
 
 class LoginWindow(QWidget):
     loginSuccess = pyqtSignal(str)  # Emits token
@@ -10,6 +11,7 @@ class LoginWindow(QWidget):
 
     def __init__(self):
         super().__init__()
+        self.tasks = TaskGroup()
         self.initUI()
 
     def initUI(self):
@@ -32,9 +34,9 @@ class LoginWindow(QWidget):
         self.password_input.setStyleSheet("padding: 10px; border-radius: 5px; border: 1px solid #4fd1c5; color: white; background: rgba(255,255,255,0.1);")
         layout.addWidget(self.password_input)
 
-        login_btn = QPushButton("Login")
-        login_btn.setCursor(Qt.PointingHandCursor)
-        login_btn.setStyleSheet("""
+        self.login_btn = QPushButton("Login")
+        self.login_btn.setCursor(Qt.PointingHandCursor)
+        self.login_btn.setStyleSheet("""
             QPushButton {
                 background-color: #4fd1c5;
                 color: #102a43;
@@ -46,8 +48,8 @@ class LoginWindow(QWidget):
                 background-color: #38b2ac;
             }
         """)
-        login_btn.clicked.connect(self.handle_login)
-        layout.addWidget(login_btn)
+        self.login_btn.clicked.connect(self.handle_login)
+        layout.addWidget(self.login_btn)
 
         reg_link = QPushButton("Don't have an account? Register")
         reg_link.setCursor(Qt.PointingHandCursor)
@@ -72,7 +74,13 @@ class LoginWindow(QWidget):
             QMessageBox.warning(self, "Error", "Please fill in all fields")
             return
 
-        result = api_client.login(username, password)
+        self.login_btn.setText("Signing in...")
+        self.login_btn.setEnabled(False)
+        self.tasks.run(api_client.login, username, password, on_result=self.on_login_finished)
+
+    def on_login_finished(self, result):
+        self.login_btn.setText("Login")
+        self.login_btn.setEnabled(True)
         if result["success"]:
             self.loginSuccess.emit(result["token"])
         else:
@@ -3,6 +3,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 from api_client import api_client
+from workers import TaskGroup
 
 class RegisterWindow(QWidget):
     registerSuccess = pyqtSignal()
@@ -10,6 +11,7 @@ class RegisterWindow(QWidget):
 
     def __init__(self):
         super().__init__()
+        self.tasks = TaskGroup()
         self.initUI()
 
     def initUI(self):
@@ -37,9 +39,9 @@ class RegisterWindow(QWidget):
         self.password_input.setStyleSheet("padding: 10px; border-radius: 5px; border: 1px solid #4fd1c5; color: white; background: rgba(255,255,255,0.1);")
         layout.addWidget(self.password_input)
 
-        reg_btn = QPushButton("Register")
-        reg_btn.setCursor(Qt.PointingHandCursor)
-        reg_btn.setStyleSheet("""
+        self.reg_btn = QPushButton("Register")
+        self.reg_btn.setCursor(Qt.PointingHandCursor)
+        self.reg_btn.setStyleSheet("""
             QPushButton {
                 background-color: #4fd1c5;
                 color: #102a43;
@@ -51,8 +53,8 @@ class RegisterWindow(QWidget):
                 background-color: #38b2ac;
             }
         """)
-        reg_btn.clicked.connect(self.handle_register)
-        layout.addWidget(reg_btn)
+        self.reg_btn.clicked.connect(self.handle_register)
+        layout.addWidget(self.reg_btn)
 
         login_link = QPushButton("Already have an account? Login")
         login_link.setCursor(Qt.PointingHandCursor)
@@ -78,7 +80,13 @@ class RegisterWindow(QWidget):
             QMessageBox.warning(self, "Error", "Please fill in all fields")
             return
 
-        result = api_client.register(username, email, password)
+        self.reg_btn.setText("Registering...")
+        self.reg_btn.setEnabled(False)
+        self.tasks.run(api_client.register, username, email, password, on_result=self.on_register_finished)
+
+    def on_register_finished(self, result):
+        self.reg_btn.setText("Register")
+        self.reg_btn.setEnabled(True)
         if result["success"]:
             QMessageBox.information(self, "Success", "Registration successful! Please login.")
             self.registerSuccess.emit()
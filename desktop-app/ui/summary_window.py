@@ -2,17 +2,26 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QScrollArea, QFileDialog, QFrame
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from api_client import api_client
-from ui.components import StatBox, ToastNotification
+from prefetch import detail_cache, is_sampled
+from ui.components import LoadingOverlay, StatBox, ToastNotification
+from workers import TaskGroup
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.colors import LogNorm
 from matplotlib.figure import Figure
 import matplotlib
+import numpy as np
 import textwrap
 
 matplotlib.use('Qt5Agg')
 
+# Scatter level of detail: above this many points in view, draw a density image
+DETAIL_POINTS = 5000
+DENSITY_BINS = 120
+ZOOM_STEP = 1.25
+
 class MplCanvas(FigureCanvas):
     def __init__(self, parent=None, width=5, height=4, dpi=100):
         self.fig = Figure(figsize=(width, height), dpi=dpi)
@@ -36,12 +45,107 @@ class MplCanvas(FigureCanvas):
             
         super(MplCanvas, self).__init__(self.fig)
 
+
+def padded_range(values, margin=0.05):
+    low, high = float(values.min()), float(values.max())
+    if low == high:
+        return low - 0.5, high + 0.5
+    pad = (high - low) * margin
+    return low - pad, high + pad
+
+
+class ScatterLOD:
+    """
+    Level-of-detail scatter on an MplCanvas. While more than DETAIL_POINTS
+    points fall inside the view it draws a 2D histogram (log colour scale);
+    zoomed in past that, the individual points, rasterized and without
+    edges. Scroll zooms around the cursor, double-click resets the view.
+
+    Both artists are created once; set_data() swaps in another dataset.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.axes = canvas.axes
+        self.x = self.y = np.empty(0)
+        self.codes = np.empty(0, dtype=int)
+        self.home = ((0, 1), (0, 1))
+
+        self.axes.set_autoscale_on(False)
+        self.points = self.axes.scatter(
+            self.x, self.y, c=self.codes, cmap="cool", vmin=0, vmax=1,
+            alpha=0.9, s=20, edgecolors="none", rasterized=True,
+        )
+        # Empty bins are masked, so they stay transparent over the dark background
+        self.density = self.axes.imshow(
+            np.ma.masked_all((1, 1)), origin="lower", aspect="auto",
+            cmap="cool", norm=LogNorm(vmin=1, vmax=10), interpolation="nearest",
+            visible=False,
+        )
+
+        # Limit changes arrive in pairs (x and y): redraw once per event loop turn
+        self.timer = QTimer(canvas)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.update)
+
+        self.axes.callbacks.connect("xlim_changed", lambda axes: self.timer.start(0))
+        self.axes.callbacks.connect("ylim_changed", lambda axes: self.timer.start(0))
+        canvas.mpl_connect("scroll_event", self.on_scroll)
+        canvas.mpl_connect("button_press_event", self.on_press)
+        self.reset_view()
+
+    def set_data(self, x, y, codes, n_types):
+        self.x, self.y, self.codes = x, y, codes
+        self.points.set_clim(0, max(n_types - 1, 1))
+        self.home = (padded_range(x), padded_range(y)) if len(x) else ((0, 1), (0, 1))
+        self.reset_view()
+        self.update()
+
+    def reset_view(self):
+        self.axes.set_xlim(*self.home[0])
+        self.axes.set_ylim(*self.home[1])
+
+    def update(self):
+        self.timer.stop()
+        (x0, x1), (y0, y1) = self.axes.get_xlim(), self.axes.get_ylim()
+        visible = (self.x >= x0) & (self.x <= x1) & (self.y >= y0) & (self.y <= y1)
+
+        dense = np.count_nonzero(visible) > DETAIL_POINTS
+        if dense:
+            counts, _, _ = np.histogram2d(
+                self.x[visible], self.y[visible],
+                bins=DENSITY_BINS, range=((x0, x1), (y0, y1)),
+            )
+            self.density.set_data(np.ma.masked_equal(counts.T, 0))
+            self.density.set_extent((x0, x1, y0, y1))
+            self.density.set_clim(1, counts.max())
+        else:
+            self.points.set_offsets(np.column_stack((self.x[visible], self.y[visible])))
+            self.points.set_array(self.codes[visible])
+        self.density.set_visible(dense)
+        self.points.set_visible(not dense)
+        self.canvas.draw_idle()
+
+    def on_scroll(self, event):
+        if event.inaxes is not self.axes:
+            return
+        scale = 1 / ZOOM_STEP if event.button == "up" else ZOOM_STEP
+        (x0, x1), (y0, y1) = self.axes.get_xlim(), self.axes.get_ylim()
+        self.axes.set_xlim(event.xdata - (event.xdata - x0) * scale, event.xdata + (x1 - event.xdata) * scale)
+        self.axes.set_ylim(event.ydata - (event.ydata - y0) * scale, event.ydata + (y1 - event.ydata) * scale)
+
+    def on_press(self, event):
+        if event.dblclick and event.inaxes is self.axes:
+            self.reset_view()
+
 class SummaryWindow(QWidget):
     backSignal = pyqtSignal()
 
     def __init__(self):
         super().__init__()
         self.dataset_id = None
+        self.tasks = TaskGroup()
+        self.downloads = TaskGroup()
         self.initUI()
 
     def initUI(self):
@@ -113,9 +217,22 @@ class SummaryWindow(QWidget):
         self.layout.addLayout(header)
 
         # Stats Grid
-        self.stats_layout = QHBoxLayout()
+        stats_widget = QWidget()
+        stats_widget.setStyleSheet("background: transparent;")
+        self.stats_layout = QHBoxLayout(stats_widget)
+        self.stats_layout.setContentsMargins(0, 0, 0, 0)
         self.stats_layout.setSpacing(15)
-        self.layout.addLayout(self.stats_layout)
+        self.layout.addWidget(stats_widget)
+
+        # Created once; load_data only updates their values
+        self.stat_boxes = {
+            "total_equipment": StatBox("Total Equipment", "--"),
+            "average_flowrate": StatBox("Avg Flowrate", "--"),
+            "average_pressure": StatBox("Avg Pressure", "--"),
+            "average_temperature": StatBox("Avg Temperature", "--"),
+        }
+        for box in self.stat_boxes.values():
+            self.stats_layout.addWidget(box)
 
         # Charts Area
         charts_header = QLabel("Visual Analysis")
@@ -139,69 +256,129 @@ class SummaryWindow(QWidget):
         charts_layout.addWidget(self.scatter_frame)
         self.layout.addLayout(charts_layout)
 
+        # Chart canvases are reused for every dataset
+        self.bar_canvas = MplCanvas(self, width=5, height=4, dpi=100)
+        self.bar_canvas.axes.set_title("Equipment Type Distribution")
+        self.bars = None
+        self.bar_layout.addWidget(self.bar_canvas)
+
+        self.scatter_canvas = MplCanvas(self, width=5, height=4, dpi=100)
+        self.scatter_canvas.axes.set_title("Pressure vs Temperature")
+        self.scatter_canvas.axes.set_xlabel("Temperature")
+        self.scatter_canvas.axes.set_ylabel("Pressure")
+        self.scatter = ScatterLOD(self.scatter_canvas)
+        self.scatter_layout.addWidget(self.scatter_canvas)
+
+        # One overlay per section: each clears as its own data arrives
+        self.stats_loading = LoadingOverlay(stats_widget, "Loading summary...")
+        self.bar_loading = LoadingOverlay(self.bar_frame, "Loading chart...")
+        self.scatter_loading = LoadingOverlay(self.scatter_frame, "Loading chart...")
+
         scroll.setWidget(content_widget)
         main_layout.addWidget(scroll)
         self.setLayout(main_layout)
 
     def load_data(self, dataset_id):
+        # Results for a previously opened dataset are dropped
+        self.tasks.cancel()
+
         self.dataset_id = dataset_id
         self.id_label.setText(f"Dataset ID: {dataset_id}")
-        
-        # Clear previous widgets
-        self.clear_layout(self.stats_layout)
-        self.clear_layout(self.bar_layout)
-        self.clear_layout(self.scatter_layout)
 
-        # Fetch data
-        summary_res = api_client.get_dataset_summary(dataset_id)
-        scatter_res = api_client.get_scatter_data(dataset_id)
+        # Both facets are requested at once; each section renders as soon
+        # as its own response arrives
+        self.set_loading(True)
+
+        # Prefetched details render at once; only what's missing is fetched
+        summary = detail_cache.get("summary", dataset_id)
+        if summary is not None:
+            self.on_summary_loaded(summary)
+        else:
+            self.tasks.run(
+                api_client.get_dataset_summary, dataset_id,
+                on_result=self.on_summary_loaded,
+            )
+
+        scatter = detail_cache.get("scatter", dataset_id)
+        if scatter is not None:
+            self.on_scatter_loaded(scatter)
+        if scatter is None or is_sampled(scatter):
+            # The sample stays on screen until the full scatter arrives
+            self.tasks.run(
+                api_client.get_scatter_data, dataset_id,
+                on_result=self.on_scatter_loaded,
+            )
 
+    def set_loading(self, loading):
+        for overlay in (self.stats_loading, self.bar_loading, self.scatter_loading):
+            overlay.start() if loading else overlay.stop()
+
+    def on_summary_loaded(self, summary_res):
+        self.stats_loading.stop()
         if not summary_res["success"]:
+            self.bar_loading.stop()
+            # Don't leave the previous dataset's numbers on screen
+            for box in self.stat_boxes.values():
+                box.set_value("--")
+            self.update_bar_chart({})
             self.toast.show_message("Failed to load summary", is_error=True)
             return
 
+        detail_cache.put("summary", self.dataset_id, summary_res)
         data = summary_res["data"]
+        if summary_res.get("offline"):
+            self.toast.show_message("Offline: showing saved data", is_error=True)
          
-        # Populate Stats using StatBox
-        self.stats_layout.addWidget(StatBox("Total Equipment", data.get("total_equipment", 0)))
-        self.stats_layout.addWidget(StatBox("Avg Flowrate", f"{data.get('average_flowrate', 0):.2f}"))
-        self.stats_layout.addWidget(StatBox("Avg Pressure", f"{data.get('average_pressure', 0):.2f}"))
-        self.stats_layout.addWidget(StatBox("Avg Temperature", f"{data.get('average_temperature', 0):.2f}"))
-
-        # Render Bar Chart
-        if "equipment_type_distribution" in data:
-            dist = data["equipment_type_distribution"]
-            canvas = MplCanvas(self, width=5, height=4, dpi=100)
-            labels = [textwrap.fill(k, 10) for k in dist.keys()]
-            values = list(dist.values())
-            
-            # Customizing bar chart
-            bars = canvas.axes.bar(labels, values, color='#4fd1c5', alpha=0.8, width=0.6)
-            canvas.axes.set_title("Equipment Type Distribution")
-            self.bar_layout.addWidget(canvas)
+        # Populate Stats
+        self.stat_boxes["total_equipment"].set_value(data.get("total_equipment", 0))
+        for key in ("average_flowrate", "average_pressure", "average_temperature"):
+            self.stat_boxes[key].set_value(f"{data.get(key, 0):.2f}")
+
+        # Let the stat boxes paint before the (slower) chart draw
+        generation = self.tasks.generation
+        QTimer.singleShot(0, lambda: self.render_bar_chart(data, generation))
+
+    def render_bar_chart(self, data, generation):
+        if generation != self.tasks.generation:
+            return  # another dataset was opened meanwhile
+        self.bar_loading.stop()
+        self.update_bar_chart(data.get("equipment_type_distribution", {}))
+
+    def update_bar_chart(self, dist):
+        axes = self.bar_canvas.axes
+        labels = [textwrap.fill(k, 10) for k in dist.keys()]
+        values = list(dist.values())
 
-        # Render Scatter Chart
+        # Same number of types: resize the existing bars
+        if self.bars is not None and len(self.bars) == len(values):
+            for bar, value in zip(self.bars, values):
+                bar.set_height(value)
+        else:
+            if self.bars is not None:
+                self.bars.remove()
+            self.bars = axes.bar(range(len(values)), values, color='#4fd1c5', alpha=0.8, width=0.6)
+            axes.set_xlim(-0.5, max(len(values), 1) - 0.5)
+
+        axes.set_xticks(range(len(values)), labels)
+        axes.set_ylim(0, max(values, default=0) * 1.05 or 1)
+        self.bar_canvas.draw_idle()
+
+    def on_scatter_loaded(self, scatter_res):
+        self.scatter_loading.stop()
         if scatter_res["success"]:
-            points = scatter_res["data"]["points"]
-            canvas = MplCanvas(self, width=5, height=4, dpi=100)
-            
-            x_vals = [p['x'] for p in points] # Temp
-            y_vals = [p['y'] for p in points] # Pressure
-            
-            types = list(set([p['equipment_type'] for p in points]))
-            colors = [types.index(p['equipment_type']) for p in points]
-            
-            scatter = canvas.axes.scatter(x_vals, y_vals, c=colors, cmap='cool', alpha=0.9, s=50, edgecolors='white', linewidth=0.5)
-            canvas.axes.set_title("Pressure vs Temperature")
-            canvas.axes.set_xlabel("Temperature")
-            canvas.axes.set_ylabel("Pressure")
-            self.scatter_layout.addWidget(canvas)
-
-    def clear_layout(self, layout):
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+            detail_cache.put("scatter", self.dataset_id, scatter_res)
+
+        points = scatter_res["data"]["points"] if scatter_res["success"] else []
+
+        # Columns as arrays; equipment types as integer codes in one pass
+        n = len(points)
+        x_vals = np.fromiter((p['x'] for p in points), dtype=float, count=n)  # Temp
+        y_vals = np.fromiter((p['y'] for p in points), dtype=float, count=n)  # Pressure
+        types, codes = np.unique(
+            np.array([p['equipment_type'] for p in points], dtype=str),
+            return_inverse=True,
+        )
+        self.scatter.set_data(x_vals, y_vals, codes, len(types))
 
     def download_report(self):
         if not self.dataset_id:
@@ -209,11 +386,26 @@ class SummaryWindow(QWidget):
             
         path, _ = QFileDialog.getSaveFileName(self, "Save Report", f"dataset_{self.dataset_id}_report.pdf", "PDF Files (*.pdf)")
         if path:
-            result = api_client.download_report(self.dataset_id, path)
-            if result["success"]:
-                self.toast.show_message("Report downloaded successfully!")
-            else:
-                self.toast.show_message(f"Download failed: {result['error']}", is_error=True)
+            self.download_btn.setText("Preparing Report...")
+            self.download_btn.setEnabled(False)
+            self.downloads.run(
+                api_client.download_report, self.dataset_id, path,
+                on_result=self.on_report_downloaded,
+            )
+
+    def on_report_downloaded(self, result):
+        self.download_btn.setText("Download Report")
+        self.download_btn.setEnabled(True)
+        if result["success"]:
+            self.toast.show_message("Report downloaded successfully!")
+        else:
+            self.toast.show_message(f"Download failed: {result['error']}", is_error=True)
+
+    # Leaving the window drops requests still loading (downloads keep going)
+    def hideEvent(self, event):
+        self.tasks.cancel()
+        self.set_loading(False)
+        super().hideEvent(event)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
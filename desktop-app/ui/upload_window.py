@@ -1,10 +1,14 @@
+import threading
+
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, 
     QMessageBox, QProgressBar
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 from api_client import api_client
+from csv_precheck import precheck_csv
 from ui.components import ToastNotification
+from workers import TaskGroup
 
 class UploadWindow(QWidget):
     uploadSuccess = pyqtSignal()
@@ -13,6 +17,9 @@ class UploadWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.file_path = None
+        self.tasks = TaskGroup()
+        # Local scan of the selected file, before anything is sent
+        self.checks = TaskGroup()
         self.initUI()
 
     def initUI(self):
@@ -56,6 +63,38 @@ class UploadWindow(QWidget):
         self.file_label.setStyleSheet("color: #4fd1c5; font-weight: bold; margin-top: 10px;")
         layout.addWidget(self.file_label, alignment=Qt.AlignCenter)
 
+        # Result of the local pre-check: row counts and summary preview
+        self.preview_label = QLabel("")
+        self.preview_label.setAlignment(Qt.AlignCenter)
+        self.preview_label.setWordWrap(True)
+        self.preview_label.setFixedWidth(400)
+        self.preview_label.setStyleSheet("color: rgba(255,255,255,0.7); font-size: 12px;")
+        layout.addWidget(self.preview_label, alignment=Qt.AlignCenter)
+
+        # Upload progress (file bytes sent), shown while uploading
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedWidth(400)
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setStyleSheet("""
+            QProgressBar {
+                background-color: rgba(255, 255, 255, 0.1);
+                border: none;
+                border-radius: 4px;
+                height: 8px;
+            }
+            QProgressBar::chunk {
+                background-color: #4fd1c5;
+                border-radius: 4px;
+            }
+        """)
+        self.progress_label = QLabel("")
+        self.progress_label.setStyleSheet("color: rgba(255,255,255,0.6); font-size: 12px;")
+        self.progress_bar.hide()
+        self.progress_label.hide()
+        layout.addWidget(self.progress_bar, alignment=Qt.AlignCenter)
+        layout.addWidget(self.progress_label, alignment=Qt.AlignCenter)
+
         # Actions
         btn_layout = QVBoxLayout()
         btn_layout.setSpacing(10)
@@ -79,13 +118,16 @@ class UploadWindow(QWidget):
         """)
         self.upload_btn.clicked.connect(self.upload_file)
 
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setCursor(Qt.PointingHandCursor)
-        cancel_btn.setStyleSheet("background: transparent; color: #e53e3e; text-decoration: underline; border: none;")
-        cancel_btn.clicked.connect(self.cancelSignal.emit)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setCursor(Qt.PointingHandCursor)
+        self.cancel_btn.setStyleSheet("""
+            QPushButton { background: transparent; color: #e53e3e; text-decoration: underline; border: none; }
+            QPushButton:disabled { color: rgba(255, 255, 255, 0.3); }
+        """)
+        self.cancel_btn.clicked.connect(self.cancel)
 
         btn_layout.addWidget(self.upload_btn, alignment=Qt.AlignCenter)
-        btn_layout.addWidget(cancel_btn, alignment=Qt.AlignCenter)
+        btn_layout.addWidget(self.cancel_btn, alignment=Qt.AlignCenter)
         layout.addLayout(btn_layout)
 
         # Main Container
@@ -99,7 +141,7 @@ class UploadWindow(QWidget):
             self.file_path = fname
             name = fname.split("/")[-1]
             self.file_label.setText(f"Selected: {name}")
-            self.upload_btn.setEnabled(True)
+            self.check_file()
             self.upload_box.setStyleSheet("""
                 QPushButton {
                     background-color: rgba(79, 209, 197, 0.1);
@@ -109,34 +151,123 @@ class UploadWindow(QWidget):
                 }
             """)
 
+    def check_file(self):
+        # Upload stays disabled until the scan passes
+        self.upload_btn.setEnabled(False)
+        self.preview_label.setStyleSheet("color: rgba(255,255,255,0.7); font-size: 12px;")
+        self.preview_label.setText("Checking file...")
+        self.checks.cancel()
+        self.checks.run(precheck_csv, self.file_path, on_result=self.on_file_checked)
+
+    def on_file_checked(self, result):
+        if not result.get("ok"):
+            error = result.get("error", "Unable to read CSV file.")
+            if "expected_columns" in result:
+                error += "\nExpected: " + ", ".join(result["expected_columns"])
+            self.preview_label.setStyleSheet("color: #fc8181; font-size: 12px;")
+            self.preview_label.setText(error)
+            return
+
+        summary = result["summary"]
+        types = list(summary["equipment_type_distribution"].items())
+        lines = [
+            f"{result['total_rows']:,} rows · {result['inserted']:,} will be stored · "
+            f"{result['failed']:,} invalid · {result['duplicates']:,} duplicates",
+        ]
+        if summary["total_equipment"]:
+            lines.append(
+                f"Avg flowrate {summary['average_flowrate']:.2f} · "
+                f"pressure {summary['average_pressure']:.2f} · "
+                f"temperature {summary['average_temperature']:.2f}"
+            )
+            lines.append(", ".join(f"{name} {count:,}" for name, count in types[:4])
+                         + (f", +{len(types) - 4} more types" if len(types) > 4 else ""))
+        for error in result["errors"][:3]:
+            lines.append(f"Row {error['row']}: " + "; ".join(error["errors"].values()))
+
+        if summary["total_equipment"]:
+            self.preview_label.setStyleSheet(
+                "color: %s; font-size: 12px;" % ("#f6ad55" if result["failed"] else "rgba(255,255,255,0.7)")
+            )
+            self.upload_btn.setEnabled(True)
+        else:
+            # Nothing would be stored: don't send it
+            self.preview_label.setStyleSheet("color: #fc8181; font-size: 12px;")
+            lines.insert(0, "No valid rows to upload.")
+        self.preview_label.setText("\n".join(lines))
+
     def upload_file(self):
         if not self.file_path:
             return
 
         self.upload_btn.setText("Uploading...")
         self.upload_btn.setEnabled(False)
-        self.repaint() 
+        self.upload_box.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_label.setText("")
+        self.progress_bar.show()
+        self.progress_label.show()
 
-        result = api_client.upload_dataset(self.file_path)
-        
+        # Stops the transfer but, unlike tasks.cancel(), keeps the result
+        self.abort_upload = threading.Event()
+        self.tasks.run(
+            api_client.upload_dataset, self.file_path,
+            cancel_event=self.abort_upload,
+            on_result=self.on_upload_finished,
+            on_progress=self.on_upload_progress,
+        )
+
+    def on_upload_progress(self, sent, total):
+        self.progress_bar.setValue(int(sent * 1000 / total) if total else 1000)
+        self.progress_label.setText(f"{sent / 2**20:.1f} / {total / 2**20:.1f} MB")
+        if sent == total:
+            # Body sent: the server is now parsing and storing it, too late to cancel
+            self.upload_btn.setText("Processing...")
+            self.cancel_btn.setEnabled(False)
+
+    def end_upload(self):
         self.upload_btn.setText("Upload Now")
-        self.upload_btn.setEnabled(True)
+        self.upload_btn.setEnabled(self.file_path is not None)
+        self.upload_box.setEnabled(True)
+        self.cancel_btn.setEnabled(True)
+        self.progress_bar.hide()
+        self.progress_label.hide()
+
+    def on_upload_finished(self, result):
+        self.end_upload()
 
         if result["success"]:
             # Show toast instead of Popup
-            self.toast.show_message("Dataset uploaded successfully!")
-            # Delay emitting success so user sees toast
+            if self.abort_upload.is_set():
+                # Cancelled after the last chunk went out: the server kept it
+                self.toast.show_message("Upload had already completed: dataset saved")
+            else:
+                self.toast.show_message("Dataset uploaded successfully!")
+            # Delay emitting success so user sees toast (refreshes the dashboard)
             QTimer.singleShot(1500, self.finish_upload)
+        elif result.get("cancelled"):
+            self.toast.show_message("Upload cancelled", is_error=True)
         else:
             self.toast.show_message(f"Upload Failed: {result['error']}", is_error=True)
     
+    def cancel(self):
+        # Mid-upload: abort the transfer and stay here; otherwise leave
+        if self.tasks.busy():
+            self.abort_upload.set()
+            self.upload_btn.setText("Cancelling...")
+            self.cancel_btn.setEnabled(False)
+            return
+        self.cancelSignal.emit()
+
     def finish_upload(self):
         self.uploadSuccess.emit()
         self.reset()
     
     def reset(self):
+        self.checks.cancel()
         self.file_path = None
         self.file_label.setText("")
+        self.preview_label.setText("")
         self.upload_btn.setEnabled(False)
         self.upload_box.setText("\n📁\n\nClick to Select CSV File")
         self.upload_box.setStyleSheet("""
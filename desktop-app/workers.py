@@ -0,0 +1,125 @@
+"""
+Background request layer for the desktop windows.
+
+API calls run on a shared QThreadPool instead of the GUI thread. Each
+window owns a TaskGroup. run() starts a call and delivers its result
+dict to a callback on the GUI thread. cancel() drops everything still
+queued or in flight, for example when the user navigates away or a
+newer request supersedes it.
+
+    self.tasks = TaskGroup()
+    self.tasks.run(api_client.get_history, on_result=self.show_history)
+    ...
+    self.tasks.cancel()
+"""
+import threading
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Requests are I/O bound: allow more threads than cores
+MAX_THREADS = 8
+
+_pool = None
+
+
+def thread_pool():
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(MAX_THREADS)
+    return _pool
+
+
+class TaskSignals(QObject):
+    finished = pyqtSignal(object)
+    progress = pyqtSignal(object, object)  # done, total
+
+
+class Task(QRunnable):
+    """
+    Runs fn(*args, **kwargs) on a pool thread and emits its result.
+    Exceptions become {"success": False, "error": ...} like api_client.
+    """
+
+    def __init__(self, fn, args, kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        if not self.cancelled:
+            self.signals.finished.emit(result)
+
+
+class TaskGroup:
+    """
+    The requests of one window. Results of cancelled tasks are never
+    delivered, even if they finish afterwards.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self.tasks = set()
+
+    def run(self, fn, *args, on_result=None, on_progress=None, priority=0, **kwargs):
+        """
+        With on_progress, fn is also passed progress(done, total), reported
+        through on_progress on the GUI thread, and the task's cancel_event
+        so it can stop mid-call. A cancel_event given by the caller is
+        passed instead: setting it stops fn but still delivers its result.
+        """
+        task = Task(fn, args, kwargs)
+        generation = self.generation
+
+        # Connected on the GUI thread, so the callbacks run there too
+        task.signals.finished.connect(
+            lambda result: self._deliver(task, generation, on_result, result)
+        )
+        if on_progress is not None:
+            kwargs["progress"] = task.signals.progress.emit
+            kwargs.setdefault("cancel_event", task.cancel_event)
+            task.signals.progress.connect(
+                lambda done, total: self._progress(task, generation, on_progress, done, total)
+            )
+
+        self.tasks.add(task)
+        thread_pool().start(task, priority)
+        return task
+
+    def _deliver(self, task, generation, on_result, result):
+        self.tasks.discard(task)
+        if generation != self.generation or task.cancelled:
+            return
+        if on_result is not None:
+            on_result(result)
+
+    def _progress(self, task, generation, on_progress, done, total):
+        if generation == self.generation and not task.cancelled:
+            on_progress(done, total)
+
+    def cancel(self):
+        self.generation += 1
+        for task in self.tasks:
+            task.cancel()
+            # Not started yet: drop it from the queue
+            thread_pool().tryTake(task)
+        self.tasks.clear()
+
+    def busy(self):
+        return bool(self.tasks)
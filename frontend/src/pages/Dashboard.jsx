@@ -3,6 +3,12 @@ import { useNavigate } from "react-router-dom";
 import { useAuth } from "../auth/AuthContext";
 import api from "../api/axios";
 
+// The report URL is rate limited, so waiting happens on the job's status URL
+const REPORT_POLL_INTERVAL_MS = 2000;
+const REPORT_TIMEOUT_MS = 5 * 60 * 1000;
+
+const readBlobJson = async (blob) => JSON.parse(await blob.text());
+
 const Dashboard = () => {
   const { user, token, loading: authLoading } = useAuth();
   const navigate = useNavigate();
@@ -32,9 +38,31 @@ const Dashboard = () => {
 
   const handleGenerateReport = async (datasetId, datasetName) => {
     try {
-      const res = await api.get(`/report/${datasetId}/`, {
+      // Reports render in the background: a 202 carries the job's status URL
+      let res = await api.get(`/report/${datasetId}/`, {
         responseType: "blob",
       });
+      const deadline = Date.now() + REPORT_TIMEOUT_MS;
+      while (res.status === 202) {
+        const { status_url: statusUrl } = await readBlobJson(res.data);
+        let job;
+        do {
+          if (Date.now() > deadline) {
+            throw new Error("Report generation timed out");
+          }
+          await new Promise((resolve) => setTimeout(resolve, REPORT_POLL_INTERVAL_MS));
+          job = (await api.get(statusUrl)).data;
+        } while (job.status !== "ready" && job.status !== "failed");
+
+        if (job.status === "failed") {
+          throw new Error(job.error || "Report generation failed");
+        }
+
+        // Ready: download it once
+        res = await api.get(`/report/${datasetId}/`, {
+          responseType: "blob",
+        });
+      }
 
       const blob = new Blob([res.data], { type: "application/pdf" });
       const url = window.URL.createObjectURL(blob);
@@ -49,7 +77,16 @@ const Dashboard = () => {
       window.URL.revokeObjectURL(url);
     } catch (err) {
       console.error("Error generating report:", err);
-      alert("Failed to generate report PDF");
+      let message = err.message;
+      if (err.response?.data instanceof Blob) {
+        // A failed render comes back as a JSON status payload
+        try {
+          message = (await readBlobJson(err.response.data)).error || message;
+        } catch {
+          // Not JSON: keep the generic message
+        }
+      }
+      alert(`Failed to generate report PDF: ${message}`);
     }
   };
 